@@ -0,0 +1,30 @@
+"""Task listing filter indexes
+
+Revision ID: 421cf0799b17
+Revises: d9e40c19dfcf
+Create Date: 2026-10-18 14:20:55.730164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '421cf0799b17'
+down_revision: Union[str, Sequence[str], None] = 'd9e40c19dfcf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_project_id_status', 'tasks', ['project_id', 'status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_project_id_deadline', 'tasks', ['project_id', 'deadline', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_project_id_deadline', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_status', table_name='tasks')
@@ -0,0 +1,47 @@
+"""Project stats table
+
+Revision ID: 5c0e7b1d92a4
+Revises: a93ac880d61f
+Create Date: 2026-10-18 15:40:27.118306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c0e7b1d92a4'
+down_revision: Union[str, Sequence[str], None] = 'a93ac880d61f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('project_stats',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('todo', sa.Integer(), nullable=False),
+    sa.Column('doing', sa.Integer(), nullable=False),
+    sa.Column('done', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id')
+    )
+    # Backfill the counters of existing projects
+    op.execute(
+        "INSERT INTO project_stats (project_id, todo, doing, done, updated_at) "
+        "SELECT projects.id, "
+        "count(tasks.id) FILTER (WHERE tasks.status = 'TODO'), "
+        "count(tasks.id) FILTER (WHERE tasks.status = 'DOING'), "
+        "count(tasks.id) FILTER (WHERE tasks.status = 'DONE'), "
+        "timezone('utc', now()) "
+        "FROM projects LEFT JOIN tasks ON tasks.project_id = projects.id "
+        "GROUP BY projects.id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('project_stats')
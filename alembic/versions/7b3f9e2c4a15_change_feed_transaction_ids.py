@@ -0,0 +1,38 @@
+"""Change feed transaction ids
+
+Revision ID: 7b3f9e2c4a15
+Revises: 5c0e7b1d92a4
+Create Date: 2026-10-18 18:05:42.270931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3f9e2c4a15'
+down_revision: Union[str, Sequence[str], None] = '5c0e7b1d92a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    current_txid = sa.text("(pg_current_xact_id())::text::bigint")
+
+    # Existing rows are stamped with this migration's transaction, which has committed
+    # (and so is below every later snapshot's xmin) by the time the feed reads them
+    for table in ('projects', 'tasks', 'tombstones'):
+        op.add_column(table, sa.Column('txid', sa.BigInteger(), server_default=current_txid, nullable=False))
+        op.drop_index(f'ix_{table}_revision', table_name=table)
+        op.create_index(f'ix_{table}_txid_revision', table, ['txid', 'revision'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('tombstones', 'tasks', 'projects'):
+        op.drop_index(f'ix_{table}_txid_revision', table_name=table)
+        op.create_index(f'ix_{table}_revision', table, ['revision'], unique=False)
+        op.drop_column(table, 'txid')
@@ -0,0 +1,33 @@
+"""Task full-text search index
+
+Revision ID: a93ac880d61f
+Revises: 421cf0799b17
+Create Date: 2026-10-18 15:02:13.604478
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a93ac880d61f'
+down_revision: Union[str, Sequence[str], None] = '421cf0799b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Must match app.models.task.TASK_SEARCH_DOCUMENT exactly for the planner to use it
+    op.create_index(
+        'ix_tasks_search', 'tasks',
+        [sa.text("to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))")],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_search', table_name='tasks')
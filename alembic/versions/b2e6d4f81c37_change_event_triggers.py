@@ -0,0 +1,76 @@
+"""Change event triggers
+
+Revision ID: b2e6d4f81c37
+Revises: 7b3f9e2c4a15
+Create Date: 2026-10-18 18:52:16.804417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e6d4f81c37'
+down_revision: Union[str, Sequence[str], None] = '7b3f9e2c4a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.realtime.events.EVENTS_CHANNEL / MAX_IDS_PER_EVENT
+EVENTS_CHANNEL = 'todolist_events'
+MAX_IDS_PER_EVENT = 500
+
+# Statement-level triggers: one NOTIFY per project (per MAX_IDS_PER_EVENT rows) for each write
+# statement, queued in the writing transaction and delivered only if it commits
+NOTIFY_FUNCTION = """
+CREATE FUNCTION notify_{table}_changes() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    event record;
+BEGIN
+    FOR event IN
+        SELECT project_id, array_agg(id ORDER BY id) AS ids
+        FROM (
+            SELECT {project_id} AS project_id, id,
+                   (row_number() OVER (PARTITION BY {project_id} ORDER BY id) - 1) / {max_ids} AS chunk
+            FROM changed_rows
+        ) AS numbered
+        GROUP BY project_id, chunk
+    LOOP
+        PERFORM pg_notify('{channel}', json_build_object(
+            'entity', '{entity}',
+            'action', CASE TG_OP WHEN 'INSERT' THEN 'created' WHEN 'UPDATE' THEN 'updated' ELSE 'deleted' END,
+            'project_id', event.project_id,
+            'ids', event.ids
+        )::text);
+    END LOOP;
+    RETURN NULL;
+END
+$$
+"""
+
+# (table, entity, expression giving the row's project)
+TABLES = (('projects', 'project', 'id'), ('tasks', 'task', 'project_id'))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, entity, project_id in TABLES:
+        op.execute(NOTIFY_FUNCTION.format(
+            table=table, entity=entity, project_id=project_id,
+            max_ids=MAX_IDS_PER_EVENT, channel=EVENTS_CHANNEL,
+        ))
+        # A trigger with a transition table may only handle one kind of event
+        for operation, transition in (('insert', 'NEW'), ('update', 'NEW'), ('delete', 'OLD')):
+            op.execute(
+                f"CREATE TRIGGER {table}_notify_{operation} AFTER {operation.upper()} ON {table} "
+                f"REFERENCING {transition} TABLE AS changed_rows "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION notify_{table}_changes()"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _, _ in reversed(TABLES):
+        for operation in ('delete', 'update', 'insert'):
+            op.execute(f"DROP TRIGGER {table}_notify_{operation} ON {table}")
+        op.execute(f"DROP FUNCTION notify_{table}_changes()")
@@ -0,0 +1,35 @@
+"""Task query indexes
+
+Revision ID: ca0e2bafd69c
+Revises: 370285b3fb66
+Create Date: 2026-10-18 09:12:41.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ca0e2bafd69c'
+down_revision: Union[str, Sequence[str], None] = '370285b3fb66'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_project_id_created_at', 'tasks', ['project_id', 'created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_tasks_open_deadline', 'tasks', ['deadline'], unique=False,
+        postgresql_where=sa.text("status != 'DONE'")
+    )
+    op.create_index('ix_projects_created_at', 'projects', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projects_created_at', table_name='projects')
+    op.drop_index('ix_tasks_open_deadline', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_created_at', table_name='tasks')
@@ -0,0 +1,52 @@
+"""Change feed revisions and tombstones
+
+Revision ID: d9e40c19dfcf
+Revises: f4d17125b778
+Create Date: 2026-10-18 12:41:09.318620
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9e40c19dfcf'
+down_revision: Union[str, Sequence[str], None] = 'f4d17125b778'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence('change_revision_seq')))
+    next_revision = sa.text("nextval('change_revision_seq')")
+
+    # Existing rows each draw a revision from the sequence as the column is added
+    op.add_column('projects', sa.Column('revision', sa.BigInteger(), server_default=next_revision, nullable=False))
+    op.create_index('ix_projects_revision', 'projects', ['revision'], unique=False)
+    op.add_column('tasks', sa.Column('revision', sa.BigInteger(), server_default=next_revision, nullable=False))
+    op.create_index('ix_tasks_revision', 'tasks', ['revision'], unique=False)
+
+    op.create_table('tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.Column('revision', sa.BigInteger(), server_default=next_revision, nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tombstones_revision', 'tombstones', ['revision'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tombstones_revision', table_name='tombstones')
+    op.drop_table('tombstones')
+    op.drop_index('ix_tasks_revision', table_name='tasks')
+    op.drop_column('tasks', 'revision')
+    op.drop_index('ix_projects_revision', table_name='projects')
+    op.drop_column('projects', 'revision')
+    op.execute(sa.schema.DropSequence(sa.Sequence('change_revision_seq')))
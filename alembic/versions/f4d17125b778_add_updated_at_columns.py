@@ -0,0 +1,40 @@
+"""Add updated_at columns
+
+Revision ID: f4d17125b778
+Revises: ca0e2bafd69c
+Create Date: 2026-10-18 11:03:27.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4d17125b778'
+down_revision: Union[str, Sequence[str], None] = 'ca0e2bafd69c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows start out as last modified when they were created
+    op.add_column('projects', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE projects SET updated_at = created_at")
+    op.alter_column('projects', 'updated_at', nullable=False)
+    op.create_index('ix_projects_updated_at', 'projects', ['updated_at'], unique=False)
+
+    op.add_column('tasks', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE tasks SET updated_at = COALESCE(closed_at, created_at)")
+    op.alter_column('tasks', 'updated_at', nullable=False)
+    op.create_index('ix_tasks_project_id_updated_at', 'tasks', ['project_id', 'updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_project_id_updated_at', table_name='tasks')
+    op.drop_column('tasks', 'updated_at')
+    op.drop_index('ix_projects_updated_at', table_name='projects')
+    op.drop_column('projects', 'updated_at')
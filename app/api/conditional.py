@@ -0,0 +1,40 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, Optional
+from fastapi import Request
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag derived from a cheap version signal (and anything else the representation depends on)."""
+    digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        # Timestamps are stored as naive UTC
+        headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+    return headers
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    True when the client's If-None-Match already names the current representation.
+    If-Modified-Since is not honoured: deleting a row does not advance max(updated_at),
+    so only the ETag (which also covers the row count) is a safe validator.
+    Comparison is weak (RFC 9110 13.1.2): the W/ prefix is ignored on both sides.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == current for tag in if_none_match.split(","))
@@ -1,6 +1,11 @@
+from enum import Enum
 from pydantic import BaseModel, Field
 from typing import Optional
 
+class ProjectInclude(str, Enum):
+    """Related collections GET /projects/{id} can embed."""
+    TASKS = "tasks"
+
 class ProjectCreate(BaseModel):
     """Schema for creating a new project."""
     name: str = Field(..., min_length=1, max_length=100, description="The name of the project.")
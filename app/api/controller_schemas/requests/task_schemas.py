@@ -1,8 +1,14 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from enum import Enum
+from typing import Optional, List
 from datetime import date
 from app.models.task import TaskStatus
 
+class TaskSortKey(str, Enum):
+    """Orderings available on task listings."""
+    CREATED_AT = "created_at"
+    DEADLINE = "deadline"
+
 class TaskCreate(BaseModel):
     """Schema for creating a new task within a project."""
     title: str = Field(..., min_length=1, max_length=150)
@@ -10,6 +16,15 @@ class TaskCreate(BaseModel):
     status: TaskStatus = Field(TaskStatus.TODO, description="Initial status of the task.")
     deadline: Optional[date] = None
 
+class TaskBatchCreate(BaseModel):
+    """Schema for creating several tasks within a project in one request."""
+    tasks: List[TaskCreate] = Field(..., description="The tasks to create, in order.")
+
+class TaskBatchStatusUpdate(BaseModel):
+    """Schema for moving several tasks of a project to one status."""
+    task_ids: List[int] = Field(..., description="IDs of the tasks to update.")
+    status: TaskStatus = Field(..., description="The status to move the tasks to.")
+
 class TaskUpdate(BaseModel):
     """Schema for updating a task. All fields are optional."""
     title: Optional[str] = Field(None, min_length=1, max_length=150)
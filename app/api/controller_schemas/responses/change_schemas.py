@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, List
+from .project_schemas import ProjectResponse
+from .task_schemas import TaskResponse
+
+class TombstoneResponse(BaseModel):
+    """Schema for a deleted project or task."""
+    entity: str
+    entity_id: int
+    project_id: Optional[int]
+    deleted_at: datetime
+    revision: int
+
+    class Config:
+        orm_mode = True
+
+class ChangesResponse(BaseModel):
+    """Schema for a page of the change feed."""
+    projects: List[ProjectResponse] = []
+    tasks: List[TaskResponse] = []
+    deleted: List[TombstoneResponse] = []
+    next_since: str
+    has_more: bool
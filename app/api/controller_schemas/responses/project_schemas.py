@@ -9,10 +9,31 @@ class ProjectResponse(BaseModel):
     name: str
     description: Optional[str]
     created_at: datetime
+    updated_at: datetime
 
     class Config:
         orm_mode = True
 
-class ProjectDetailResponse(ProjectResponse):
-    """Schema for a single project including its tasks."""
-    tasks: List[TaskResponse] = []
+class ProjectStatsResponse(BaseModel):
+    """Schema for the task counts of a project."""
+    project_id: int
+    name: str
+    todo: int
+    doing: int
+    done: int
+    overdue: int
+
+    class Config:
+        orm_mode = True
+
+class ProjectProjectionResponse(BaseModel):
+    """Schema for a project restricted to the requested fields; fields not selected are omitted."""
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    tasks: Optional[List[TaskResponse]] = None
+
+    class Config:
+        orm_mode = True
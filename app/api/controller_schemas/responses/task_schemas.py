@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime, date
 from app.models.task import TaskStatus
 
@@ -11,8 +11,25 @@ class TaskResponse(BaseModel):
     status: TaskStatus
     deadline: Optional[datetime]
     created_at: datetime
+    updated_at: datetime
     closed_at: Optional[datetime]
     project_id: int
 
     class Config:
         orm_mode = True
+
+class TaskSearchResult(BaseModel):
+    """Schema for a task matched by full-text search, with its relevance."""
+    task: TaskResponse
+    rank: float
+
+class TaskBatchError(BaseModel):
+    """Schema for a task that could not be created in a batch."""
+    index: int
+    type: str
+    message: str
+
+class TaskBatchResponse(BaseModel):
+    """Schema for the result of a batch task creation."""
+    created: List[TaskResponse] = []
+    errors: List[TaskBatchError] = []
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.services.change_service import ChangeService
+from app.repositories.change_repository import SQLAlchemyChangeRepository
+from app.api.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.api.controller_schemas.responses import change_schemas as change_responses
+
+router = APIRouter()
+
+# Dependency for ChangeService
+def get_change_service(db: AsyncSession = Depends(get_db)) -> ChangeService:
+    return ChangeService(SQLAlchemyChangeRepository(db))
+
+@router.get("/", response_model=change_responses.ChangesResponse, summary="List changes since a revision")
+async def list_changes(
+    since: str = Query("0", description="The next_since value of the previous call; 0 for a full sync."),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of changes to return."),
+    service: ChangeService = Depends(get_change_service)
+):
+    """
+    Return projects and tasks created or modified after `since`, plus tombstones for deleted ones.
+    Keep calling with the returned `next_since` while `has_more` is true.
+    """
+    return await service.changes_since(since, limit)
@@ -0,0 +1,59 @@
+import json
+from typing import Optional
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.realtime.broker import get_event_broker
+
+router = APIRouter()
+
+# Seconds between SSE keep-alive comments when no event arrives
+HEARTBEAT_INTERVAL = 15
+
+@router.get("/stream", summary="Subscribe to change events (Server-Sent Events)")
+async def stream_events(
+    project_id: Optional[int] = Query(None, description="Only receive events for this project.")
+):
+    """
+    Push project and task change events as Server-Sent Events.
+    Clients that fall too far behind, or that were connected when the server lost its database
+    listener, are disconnected and should reconnect and re-sync.
+    """
+    broker = get_event_broker()
+
+    async def event_stream():
+        # Subscribed only once the response is actually streamed, so the finally below always
+        # unsubscribes it (a client gone before the body starts never registers a queue)
+        subscriber = await broker.subscribe(project_id)
+        try:
+            while not subscriber.dropped:
+                event = await subscriber.next_event(timeout=HEARTBEAT_INTERVAL)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event['entity']}.{event['action']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            broker.unsubscribe(subscriber)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+@router.websocket("/ws")
+async def websocket_events(websocket: WebSocket, project_id: Optional[int] = None):
+    """
+    Push project and task change events over a WebSocket, one JSON message per event.
+    """
+    broker = get_event_broker()
+    await websocket.accept()
+    subscriber = await broker.subscribe(project_id)
+    try:
+        while True:
+            event = await subscriber.next_event()
+            if event is None:
+                # Dropped as a slow consumer or after losing the database connection
+                await websocket.close(code=1013, reason="Event stream interrupted, re-sync")
+                return
+            await websocket.send_json(event)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broker.unsubscribe(subscriber)
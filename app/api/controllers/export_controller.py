@@ -0,0 +1,40 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.services.export_service import ExportService
+from app.repositories.project_repository import SQLAlchemyProjectRepository
+from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+router = APIRouter()
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Dependency for ExportService
+def get_export_service(db: AsyncSession = Depends(get_db)) -> ExportService:
+    return ExportService(SQLAlchemyProjectRepository(db), SQLAlchemyTaskRepository(db))
+
+@router.get("/projects", summary="Export all projects")
+async def export_projects(
+    format: str = Query("ndjson", description="Output format: ndjson or csv."),
+    service: ExportService = Depends(get_export_service)
+):
+    """
+    Stream every project as NDJSON or CSV, reading through a server-side cursor.
+    """
+    chunks = await service.export_projects(format)
+    return StreamingResponse(chunks, media_type=MEDIA_TYPES[format])
+
+@router.get("/tasks", summary="Export tasks")
+async def export_tasks(
+    format: str = Query("ndjson", description="Output format: ndjson or csv."),
+    project_id: Optional[int] = Query(None, description="Only export the tasks of this project."),
+    service: ExportService = Depends(get_export_service)
+):
+    """
+    Stream every task, or the tasks of one project, as NDJSON or CSV, reading through a server-side cursor.
+    """
+    chunks = await service.export_tasks(format, project_id)
+    return StreamingResponse(chunks, media_type=MEDIA_TYPES[format])
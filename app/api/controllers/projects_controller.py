@@ -1,20 +1,36 @@
-from typing import List
-from fastapi import APIRouter, Depends, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.services.project_service import ProjectService
+from app.services.project_stats_service import ProjectStatsService
 from app.repositories.project_repository import SQLAlchemyProjectRepository
-from app.core.config import Config
+from app.repositories.project_stats_repository import SQLAlchemyProjectStatsRepository
+from app.core.config import Config, get_config
+from app.api.dependencies import get_project_repository
+from app.api.conditional import make_etag, validator_headers, is_not_modified
+from app.api.responses import row_dicts
+from app.api.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 from app.api.controller_schemas.requests import project_schemas
 from app.api.controller_schemas.responses import project_schemas as project_responses
 
 router = APIRouter()
 
 # Dependency for ProjectService
-def get_project_service(db: AsyncSession = Depends(get_db)) -> ProjectService:
-    repo = SQLAlchemyProjectRepository(db)
-    return ProjectService(repo, Config())
+def get_project_service(
+    repo: SQLAlchemyProjectRepository = Depends(get_project_repository),
+    config: Config = Depends(get_config)
+) -> ProjectService:
+    return ProjectService(repo, config)
+
+# Dependency for ProjectStatsService
+def get_project_stats_service(
+    db: AsyncSession = Depends(get_db),
+    config: Config = Depends(get_config)
+) -> ProjectStatsService:
+    return ProjectStatsService(SQLAlchemyProjectStatsRepository(db), config)
 
 @router.post(
     "/",
@@ -32,19 +48,63 @@ async def create_project(
     project = await service.create_project(name=project_in.name, description=project_in.description)
     return project
 
-@router.get("/", response_model=List[project_responses.ProjectResponse], summary="List all projects")
-async def list_projects(service: ProjectService = Depends(get_project_service)):
+@router.get(
+    "/",
+    response_model=List[project_responses.ProjectResponse],
+    response_class=ORJSONResponse,
+    summary="List all projects"
+)
+async def list_projects(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of projects to return."),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page."),
+    service: ProjectService = Depends(get_project_service)
+):
     """
-    Retrieve a list of all projects.
+    Retrieve a page of projects ordered by creation time.
+    When more projects may follow, the cursor for the next page is sent in the X-Next-Cursor header.
+    Answers 304 Not Modified when If-None-Match holds the current ETag.
+    Rows are encoded straight to JSON with orjson, bypassing ORM instances and response-model validation.
     """
-    return await service.list_projects()
+    last_modified, count = await service.listing_version()
+    etag = make_etag("projects", last_modified, count, limit, after)
+    headers = validator_headers(etag, last_modified)
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    projects = await service.list_projects(limit=limit, after=decode_cursor(after))
+    if len(projects) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(projects[-1])
+    return ORJSONResponse(row_dicts(projects), headers=headers)
 
-@router.get("/{project_id}", response_model=project_responses.ProjectDetailResponse, summary="Get a specific project")
-async def get_project(project_id: int, service: ProjectService = Depends(get_project_service)):
+@router.get("/stats", response_model=List[project_responses.ProjectStatsResponse], summary="Task counts per project")
+async def project_stats(service: ProjectStatsService = Depends(get_project_stats_service)):
     """
-    Get detailed information for a single project by its ID, including all its tasks.
+    Count the todo, doing, done and overdue tasks of every project in a single query.
     """
-    return await service.get_project_with_tasks(project_id)
+    return await service.project_stats()
+
+@router.get(
+    "/{project_id}",
+    response_model=project_responses.ProjectProjectionResponse,
+    response_model_exclude_unset=True,
+    summary="Get a specific project"
+)
+async def get_project(
+    project_id: int,
+    include: List[project_schemas.ProjectInclude] = Query([], description="Related data to embed, e.g. include=tasks."),
+    fields: Optional[str] = Query(None, description="Comma-separated project fields to return; id is always included."),
+    service: ProjectService = Depends(get_project_service)
+):
+    """
+    Get a single project by its ID. Only the requested `fields` are selected from the database,
+    and its tasks are loaded only with include=tasks.
+    """
+    return await service.get_project(
+        project_id,
+        fields=[field.strip() for field in fields.split(",") if field.strip()] if fields else None,
+        include_tasks=project_schemas.ProjectInclude.TASKS in include,
+    )
 
 
 @router.put("/{project_id}", response_model=project_responses.ProjectResponse, summary="Update a project")
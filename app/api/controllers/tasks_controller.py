@@ -1,22 +1,40 @@
-from typing import List
-from fastapi import APIRouter, Depends, status
+from typing import List, Optional
+from datetime import date
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.services.task_service import TaskService
 from app.repositories.project_repository import SQLAlchemyProjectRepository
 from app.repositories.task_repository import SQLAlchemyTaskRepository
-from app.core.config import Config
+from app.core.config import Config, get_config
+from app.api.dependencies import get_project_repository, get_project_stats_repository
+from app.repositories.project_stats_repository import SQLAlchemyProjectStatsRepository
+from app.api.conditional import make_etag, validator_headers, is_not_modified
+from app.api.responses import row_dicts
+from app.api.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 from app.api.controller_schemas.requests import task_schemas
+from app.models.task import TaskStatus
 from app.api.controller_schemas.responses import task_schemas as task_responses
 
 router = APIRouter()
 
+# Cross-project task routes, mounted under /tasks
+search_router = APIRouter()
+
+# Routes whose path continues past ".../tasks" without a slash (e.g. "tasks:batch")
+batch_router = APIRouter()
+
 # Dependency for TaskService
-def get_task_service(db: AsyncSession = Depends(get_db)) -> TaskService:
-    project_repo = SQLAlchemyProjectRepository(db)
+def get_task_service(
+    db: AsyncSession = Depends(get_db),
+    project_repo: SQLAlchemyProjectRepository = Depends(get_project_repository),
+    stats_repo: Optional[SQLAlchemyProjectStatsRepository] = Depends(get_project_stats_repository),
+    config: Config = Depends(get_config)
+) -> TaskService:
     task_repo = SQLAlchemyTaskRepository(db)
-    return TaskService(project_repo, task_repo, Config())
+    return TaskService(project_repo, task_repo, config, stats=stats_repo)
 
 @router.post(
     "/",
@@ -41,12 +59,122 @@ async def create_task(
     )
     return task
 
-@router.get("/", response_model=List[task_responses.TaskResponse], summary="List tasks in a project")
-async def list_tasks(project_id: int, service: TaskService = Depends(get_task_service)):
+@batch_router.post(
+    "/{project_id}/tasks:batch",
+    response_model=task_responses.TaskBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create several tasks in a project"
+)
+async def create_tasks_batch(
+    project_id: int,
+    batch_in: task_schemas.TaskBatchCreate,
+    service: TaskService = Depends(get_task_service)
+):
+    """
+    Create many tasks within a specified project in a single transaction.
+    Tasks that fail validation are reported by their index in `errors`; the rest are created.
+    """
+    tasks, errors = await service.create_tasks(
+        project_id,
+        [
+            {
+                "title": task_in.title,
+                "description": task_in.description,
+                "status": task_in.status.value,
+                "deadline_str": str(task_in.deadline) if task_in.deadline else None,
+            }
+            for task_in in batch_in.tasks
+        ]
+    )
+    return {
+        "created": tasks,
+        "errors": [
+            {"index": index, "type": type(exc).__name__, "message": str(exc)}
+            for index, exc in errors
+        ]
+    }
+
+@batch_router.patch(
+    "/{project_id}/tasks:status",
+    response_model=List[task_responses.TaskResponse],
+    summary="Change the status of several tasks"
+)
+async def update_tasks_status(
+    project_id: int,
+    update_in: task_schemas.TaskBatchStatusUpdate,
+    service: TaskService = Depends(get_task_service)
+):
+    """
+    Move several tasks of a project to the same status in one update.
+    Returns the updated tasks; IDs that do not belong to the project are skipped.
+    """
+    return await service.change_tasks_status(project_id, update_in.task_ids, update_in.status.value)
+
+@search_router.get(
+    "/search",
+    response_model=List[task_responses.TaskSearchResult],
+    summary="Search tasks by keyword"
+)
+async def search_tasks(
+    q: str = Query(..., min_length=1, description="Keywords; supports \"quoted phrases\", OR and -exclusions."),
+    project_id: Optional[int] = Query(None, description="Only search the tasks of this project."),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of results."),
+    offset: int = Query(0, ge=0, description="Number of results to skip."),
+    service: TaskService = Depends(get_task_service)
+):
+    """
+    Full-text search over task titles and descriptions across all projects, best matches first.
+    """
+    results = await service.search_tasks(q, project_id, limit, offset)
+    return [{"task": task, "rank": rank} for task, rank in results]
+
+@router.get(
+    "/",
+    response_model=List[task_responses.TaskResponse],
+    response_class=ORJSONResponse,
+    summary="List tasks in a project"
+)
+async def list_tasks(
+    project_id: int,
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of tasks to return."),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page."),
+    status_in: Optional[List[TaskStatus]] = Query(None, alias="status", description="Only tasks in these statuses."),
+    deadline_from: Optional[date] = Query(None, description="Only tasks due on or after this date."),
+    deadline_to: Optional[date] = Query(None, description="Only tasks due on or before this date."),
+    closed: Optional[bool] = Query(None, description="Only closed (true) or open (false) tasks."),
+    sort: task_schemas.TaskSortKey = Query(task_schemas.TaskSortKey.CREATED_AT, description="Sort key."),
+    service: TaskService = Depends(get_task_service)
+):
     """
-    Retrieve all tasks associated with a specific project.
+    Retrieve a page of tasks associated with a specific project, optionally filtered by status,
+    deadline range and open/closed state, ordered by creation time or deadline.
+    When more tasks may follow, the cursor for the next page is sent in the X-Next-Cursor header.
+    Answers 304 Not Modified when If-None-Match holds the current ETag.
+    Rows are encoded straight to JSON with orjson, bypassing ORM instances and response-model validation.
     """
-    return await service.list_tasks(project_id)
+    last_modified, count = await service.tasks_version(project_id)
+    etag = make_etag(
+        "tasks", project_id, last_modified, count, limit, after,
+        status_in, deadline_from, deadline_to, closed, sort.value
+    )
+    headers = validator_headers(etag, last_modified)
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    tasks = await service.list_tasks(
+        project_id,
+        limit=limit,
+        after=decode_cursor(after, sort.value),
+        statuses=[task_status.value for task_status in status_in] if status_in else None,
+        deadline_from_str=str(deadline_from) if deadline_from else None,
+        deadline_to_str=str(deadline_to) if deadline_to else None,
+        closed=closed,
+        sort=sort.value,
+    )
+    if len(tasks) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(tasks[-1], sort.value)
+    return ORJSONResponse(row_dicts(tasks), headers=headers)
 
 @router.patch(
     "/{task_id}",
@@ -0,0 +1,26 @@
+from typing import Optional
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.core.cache import get_project_cache
+from app.core.config import Config, get_config
+from app.repositories.project_repository import SQLAlchemyProjectRepository
+from app.repositories.cached_project_repository import CachedProjectRepository
+from app.repositories.project_stats_repository import SQLAlchemyProjectStatsRepository
+
+# Dependency for the project repository, cached unless PROJECT_CACHE_BACKEND=none
+def get_project_repository(db: AsyncSession = Depends(get_db)) -> SQLAlchemyProjectRepository:
+    cache = get_project_cache()
+    if cache is None:
+        return SQLAlchemyProjectRepository(db)
+    return CachedProjectRepository(db, cache)
+
+# Dependency for the project_stats counters; None unless PROJECT_STATS_TABLE is enabled
+def get_project_stats_repository(
+    db: AsyncSession = Depends(get_db),
+    config: Config = Depends(get_config)
+) -> Optional[SQLAlchemyProjectStatsRepository]:
+    if not config.project_stats_table:
+        return None
+    return SQLAlchemyProjectStatsRepository(db)
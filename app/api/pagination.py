@@ -0,0 +1,30 @@
+import base64
+from datetime import datetime
+from typing import Any, Optional, Tuple
+from app.exceptions.base import ValidationError
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(row: Any, key: str = "created_at") -> str:
+    """Build an opaque cursor from the (sort key, id) of the last row on a page."""
+    value = getattr(row, key)
+    raw = f"{key}|{value.isoformat() if value is not None else ''}|{row.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: Optional[str], key: str = "created_at") -> Optional[Tuple[Optional[datetime], int]]:
+    """Turn a cursor from `encode_cursor` back into a (sort key value, id) pair."""
+    if cursor is None:
+        return None
+    try:
+        cursor_key, value, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        if cursor_key != key:
+            raise ValueError(cursor_key)
+        return (datetime.fromisoformat(value) if value else None), int(row_id)
+    except ValueError:
+        raise ValidationError(f"Invalid pagination cursor '{cursor}'")
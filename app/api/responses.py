@@ -0,0 +1,11 @@
+from typing import Any, Dict, List, Sequence
+from sqlalchemy.engine import Row
+
+
+def row_dicts(rows: Sequence[Row]) -> List[Dict[str, Any]]:
+    """
+    Turn plain result rows into JSON-ready dicts keyed by column label, for
+    fastapi.responses.ORJSONResponse: orjson renders datetimes as ISO 8601 strings
+    and enums as their values, matching the pydantic response models.
+    """
+    return [row._asdict() for row in rows]
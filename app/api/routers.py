@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from .controllers import projects_controller, tasks_controller
+from .controllers import projects_controller, tasks_controller, export_controller, changes_controller, events_controller
 
 api_router = APIRouter()
 
@@ -8,3 +8,18 @@ api_router.include_router(projects_controller.router, prefix="/projects", tags=[
 
 # Include the tasks router nested under projects
 api_router.include_router(tasks_controller.router, prefix="/projects/{project_id}/tasks", tags=["Tasks"])
+
+# Batch task routes ("/projects/{project_id}/tasks:batch") sit beside the nested tasks router
+api_router.include_router(tasks_controller.batch_router, prefix="/projects", tags=["Tasks"])
+
+# Cross-project task search
+api_router.include_router(tasks_controller.search_router, prefix="/tasks", tags=["Tasks"])
+
+# Include the streaming export router
+api_router.include_router(export_controller.router, prefix="/export", tags=["Export"])
+
+# Include the change feed router
+api_router.include_router(changes_controller.router, prefix="/changes", tags=["Changes"])
+
+# Include the realtime event routers (SSE and WebSocket)
+api_router.include_router(events_controller.router, prefix="/events", tags=["Events"])
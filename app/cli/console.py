@@ -8,6 +8,7 @@ from app.models.project import Project
 from app.models.task import Task, TaskStatus
 from app.repositories.project_repository import SQLAlchemyProjectRepository
 from app.repositories.task_repository import SQLAlchemyTaskRepository
+from app.repositories.project_stats_repository import SQLAlchemyProjectStatsRepository
 from app.db.session import AsyncSessionLocal  # Use the async session for all operations now
 from app.core.config import Config
 from app.exceptions.base import TodoListError
@@ -79,7 +80,8 @@ class CLI:
                     project_repo = SQLAlchemyProjectRepository(db)
                     task_repo = SQLAlchemyTaskRepository(db)
                     project_service = ProjectService(project_repo, self.config)
-                    task_service = TaskService(project_repo, task_repo, self.config)
+                    stats_repo = SQLAlchemyProjectStatsRepository(db) if self.config.project_stats_table else None
+                    task_service = TaskService(project_repo, task_repo, self.config, stats=stats_repo)
 
                     if choice == "1":
                         name = await asyncio.to_thread(get_input, "Project name: ")
@@ -1,29 +1,33 @@
 import asyncio
-from datetime import datetime
+from collections import defaultdict
+from typing import Dict, List, Optional
 from app.db.session import AsyncSessionLocal
 from app.repositories.task_repository import SQLAlchemyTaskRepository
-from app.models.task import TaskStatus
+from app.repositories.project_stats_repository import SQLAlchemyProjectStatsRepository
+from app.core.config import get_config
 
-async def autoclose_overdue_tasks() -> None:
+async def autoclose_overdue_tasks(batch_size: Optional[int] = None) -> int:
     """
     The core logic to find and close overdue tasks, now called directly
-    by the async-native scheduler.
+    by the async-native scheduler. Tasks are closed with set-based UPDATEs,
+    in chunks of `batch_size` rows when given. Returns the number of tasks closed.
     """
     print("Running auto-close for overdue tasks...")
     async with AsyncSessionLocal() as db:
         repo = SQLAlchemyTaskRepository(db)
-        overdue_tasks = await repo.get_overdue_tasks()
-        if not overdue_tasks:
+        closed = await repo.close_overdue_tasks(batch_size)
+        if not closed:
             print("No overdue tasks to close.")
-            return
+            return 0
 
-        for task in overdue_tasks:
-            task.status = TaskStatus.DONE
-            task.closed_at = datetime.utcnow()
-
-        await db.commit()
-        print(f"Closed {len(overdue_tasks)} overdue tasks.")
+        by_project: Dict[int, List[int]] = defaultdict(list)
+        for task_id, project_id in closed:
+            by_project[project_id].append(task_id)
+        if get_config().project_stats_table:
+            await SQLAlchemyProjectStatsRepository(db).refresh(by_project)
+        print(f"Closed {len(closed)} overdue tasks.")
+        return len(closed)
 
 
 if __name__ == "__main__":
-    asyncio.run(autoclose_overdue_tasks())
+    asyncio.run(autoclose_overdue_tasks(get_config().autoclose_batch_size))
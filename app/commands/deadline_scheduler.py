@@ -0,0 +1,97 @@
+import asyncio
+from datetime import datetime
+from typing import Optional
+import asyncpg
+from app.db.session import AsyncSessionLocal
+from app.repositories.task_repository import SQLAlchemyTaskRepository
+from app.commands.autoclose_overdue import autoclose_overdue_tasks
+from app.realtime.broker import get_event_broker
+from app.core.config import get_config
+
+
+class DeadlineScheduler:
+    """
+    Auto-closes overdue tasks exactly when their deadline passes.
+    It looks up the next open deadline (an index lookup), sleeps until then, and is woken
+    early by task created/updated events so a newly added earlier deadline is not missed.
+    `max_sleep` bounds every sleep as a safety net against missed notifications.
+    A failed iteration (e.g. the database is unreachable), or overdue tasks it could not close
+    because another process holds their row locks, backs off exponentially up to `max_sleep`.
+    """
+
+    # First back-off delay in seconds; doubled after each consecutive failure
+    initial_backoff = 1.0
+
+    def __init__(self, batch_size: Optional[int] = None, max_sleep: float = 300) -> None:
+        self.batch_size = batch_size
+        self.max_sleep = max_sleep
+        self._wake = asyncio.Event()
+
+    async def run(self) -> None:
+        watcher = asyncio.create_task(self._watch_task_events())
+        backoff = self.initial_backoff
+        try:
+            while True:
+                try:
+                    # Cleared before the lookup so an event arriving meanwhile still wakes the next sleep
+                    self._wake.clear()
+                    next_deadline = await self._next_deadline()
+                    now = datetime.utcnow()
+                    if next_deadline is not None and next_deadline < now:
+                        if await autoclose_overdue_tasks(self.batch_size):
+                            backoff = self.initial_backoff
+                            continue
+                        # Every overdue task is locked by another closer (SKIP LOCKED): wait for it
+                        timeout = min(self.max_sleep, backoff)
+                        backoff *= 2
+                    else:
+                        backoff = self.initial_backoff
+                        timeout = self.max_sleep
+                        if next_deadline is not None:
+                            timeout = min(timeout, (next_deadline - now).total_seconds() + 0.001)
+                except Exception as e:
+                    delay = min(self.max_sleep, backoff)
+                    print(f"Deadline scheduler: iteration failed ({e!r}); retrying in {delay:g}s.")
+                    await asyncio.sleep(delay)
+                    backoff *= 2
+                    continue
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            watcher.cancel()
+
+    async def _next_deadline(self) -> Optional[datetime]:
+        async with AsyncSessionLocal() as db:
+            return await SQLAlchemyTaskRepository(db).next_open_deadline()
+
+    async def _watch_task_events(self) -> None:
+        """Wake the scheduler whenever a task is created or updated (its deadline may be earlier)."""
+        broker = get_event_broker()
+        while True:
+            try:
+                subscriber = await broker.subscribe()
+            except (OSError, asyncpg.PostgresError) as e:
+                # Database unreachable: fall back to the max_sleep safety net until it is back
+                print(f"Deadline scheduler: cannot listen for task events ({e}); retrying.")
+                self._wake.set()
+                await asyncio.sleep(min(self.max_sleep, 5))
+                continue
+            try:
+                while not subscriber.dropped:
+                    event = await subscriber.next_event()
+                    if event is not None and event["entity"] == "task" and event["action"] != "deleted":
+                        self._wake.set()
+            finally:
+                broker.unsubscribe(subscriber)
+            # Dropped (slow consumer or lost connection): re-check the deadline and subscribe again
+            self._wake.set()
+
+
+if __name__ == "__main__":
+    config = get_config()
+    try:
+        asyncio.run(DeadlineScheduler(config.autoclose_batch_size, config.scheduler_max_sleep).run())
+    except KeyboardInterrupt:
+        print("\nScheduler stopped by user.")
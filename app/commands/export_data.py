@@ -0,0 +1,31 @@
+import argparse
+import asyncio
+import sys
+from typing import Optional
+from app.db.session import AsyncSessionLocal
+from app.repositories.project_repository import SQLAlchemyProjectRepository
+from app.repositories.task_repository import SQLAlchemyTaskRepository
+from app.services.export_service import ExportService, EXPORT_FORMATS
+
+async def export_data(entity: str, fmt: str, project_id: Optional[int] = None) -> None:
+    """
+    Stream all projects or tasks to stdout as NDJSON or CSV.
+    Rows are read through a server-side cursor, so memory use does not grow with the export size.
+    """
+    async with AsyncSessionLocal() as db:
+        service = ExportService(SQLAlchemyProjectRepository(db), SQLAlchemyTaskRepository(db))
+        if entity == "projects":
+            chunks = await service.export_projects(fmt)
+        else:
+            chunks = await service.export_tasks(fmt, project_id)
+        async for chunk in chunks:
+            sys.stdout.write(chunk)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export projects or tasks as NDJSON or CSV.")
+    parser.add_argument("entity", choices=("projects", "tasks"))
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--project-id", type=int, default=None, help="Only export the tasks of this project.")
+    args = parser.parse_args()
+    asyncio.run(export_data(args.entity, args.format, args.project_id))
@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import time
+from itertools import islice
+from typing import Any, Iterator, List, Tuple
+from app.db.session import AsyncSessionLocal
+from app.repositories.project_repository import SQLAlchemyProjectRepository
+from app.repositories.task_repository import SQLAlchemyTaskRepository
+from app.repositories.project_stats_repository import SQLAlchemyProjectStatsRepository
+from app.services.project_service import ProjectService
+from app.services.task_service import TaskService
+from app.core.config import get_config
+
+
+def read_rows(path: str, fmt: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Lazily yield (line number, row) pairs from an NDJSON or CSV file.
+    A line that cannot be parsed yields None as its row, so it is rejected by validation
+    with its line number instead of aborting the import.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            while True:
+                try:
+                    row = next(reader)
+                except StopIteration:
+                    return
+                except csv.Error:
+                    row = None
+                yield reader.line_num, row
+        for line, text in enumerate(f, start=1):
+            if text.strip():
+                try:
+                    yield line, json.loads(text)
+                except json.JSONDecodeError:
+                    yield line, None
+
+
+def chunked(rows: Iterator[Tuple[int, Any]], size: int) -> Iterator[List[Tuple[int, Any]]]:
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+async def import_data(entity: str, path: str, fmt: str, batch_size: int = 5000) -> None:
+    """
+    Stream a file of projects or tasks into the database with PostgreSQL COPY.
+    The file is read, validated and loaded `batch_size` rows at a time, so memory stays
+    bounded; each batch is committed on its own. Rejected rows are reported on stderr.
+    """
+    start = time.perf_counter()
+    loaded = rejected = 0
+    async with AsyncSessionLocal() as db:
+        project_repo = SQLAlchemyProjectRepository(db)
+        if entity == "projects":
+            import_chunk = ProjectService(project_repo, get_config()).import_projects
+        else:
+            task_repo = SQLAlchemyTaskRepository(db)
+            stats_repo = SQLAlchemyProjectStatsRepository(db) if get_config().project_stats_table else None
+            import_chunk = TaskService(project_repo, task_repo, get_config(), stats=stats_repo).import_tasks
+
+        for chunk in chunked(read_rows(path, fmt), batch_size):
+            count, errors = await import_chunk(chunk)
+            loaded += count
+            rejected += len(errors)
+            for line, error in errors:
+                print(f"line {line}: {error}", file=sys.stderr)
+            elapsed = time.perf_counter() - start
+            print(f"Loaded {loaded} {entity} ({loaded / elapsed:.0f} rows/s), rejected {rejected}.")
+
+    elapsed = time.perf_counter() - start
+    print(f"Done: {loaded} {entity} loaded, {rejected} rejected in {elapsed:.1f}s.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-import projects or tasks from NDJSON or CSV.")
+    parser.add_argument("entity", choices=("projects", "tasks"))
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=("ndjson", "csv"), default=None,
+                        help="Defaults to the file extension.")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+    fmt = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+    asyncio.run(import_data(args.entity, args.path, fmt, args.batch_size))
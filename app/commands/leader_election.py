@@ -0,0 +1,75 @@
+import asyncio
+from typing import Awaitable, Callable
+import asyncpg
+
+
+class LeaderElection:
+    """
+    Runs a job on only one replica at a time, elected with a session-level Postgres advisory lock.
+    The leader renews its lease every `lease_interval` seconds by checking that the connection
+    holding the lock is still alive; if it is not, the job is cancelled (Postgres has already
+    released the lock) and the replica goes back to campaigning. Followers retry at the same
+    interval, so a new leader takes over within about one interval of a failure. If the job
+    itself fails, the replica likewise releases the lock and campaigns again after an interval.
+    The lock connection must not go through a transaction-pooling proxy such as pgbouncer.
+    """
+
+    def __init__(self, dsn: str, lock_id: int, lease_interval: float = 10) -> None:
+        self.dsn = dsn
+        self.lock_id = lock_id
+        self.lease_interval = lease_interval
+
+    async def run(self, job: Callable[[], Awaitable[None]]) -> None:
+        """Campaign forever, running `job` whenever this replica is the leader."""
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                print(f"Leader election: cannot connect ({e}); retrying.")
+                await asyncio.sleep(self.lease_interval)
+                continue
+            lost = False
+            try:
+                if await connection.fetchval("SELECT pg_try_advisory_lock($1)", self.lock_id):
+                    print("Leader election: acquired leadership.")
+                    await self._lead(connection, job)
+                else:
+                    await asyncio.sleep(self.lease_interval)
+            except Exception as e:
+                # A lost lock connection or a failure of the job itself: step down either way
+                # so another replica can lead, rather than letting the error end the campaign
+                print(f"Leader election: lost leadership ({e!r}).")
+                lost = True
+            finally:
+                # Closing the session releases the advisory lock if it is still held
+                try:
+                    await connection.close(timeout=self.lease_interval)
+                except Exception:
+                    connection.terminate()
+            if lost:
+                await asyncio.sleep(self.lease_interval)
+
+    async def _lead(self, connection: asyncpg.Connection, job: Callable[[], Awaitable[None]]) -> None:
+        running = asyncio.create_task(job())
+        try:
+            while not running.done():
+                await asyncio.wait([running], timeout=self.lease_interval)
+                if not running.done():
+                    await self._renew(connection)
+            running.result()
+        finally:
+            # The caller releases the lock next: wait until the job has really stopped, so no
+            # other replica can start leading while it is still mid-write
+            running.cancel()
+            cancelled = False
+            while not running.done():
+                try:
+                    await asyncio.wait([running])
+                except asyncio.CancelledError:
+                    cancelled = True
+            if cancelled:
+                raise asyncio.CancelledError
+
+    async def _renew(self, connection: asyncpg.Connection) -> None:
+        """Check that the session holding the lock is still alive."""
+        await asyncio.wait_for(connection.fetchval("SELECT 1"), self.lease_interval)
@@ -0,0 +1,16 @@
+import asyncio
+from app.db.session import AsyncSessionLocal
+from app.repositories.project_stats_repository import SQLAlchemyProjectStatsRepository
+
+async def refresh_project_stats() -> None:
+    """
+    Recount the project_stats counters of every project, e.g. after enabling
+    PROJECT_STATS_TABLE on a database that ran without it.
+    """
+    async with AsyncSessionLocal() as db:
+        await SQLAlchemyProjectStatsRepository(db).refresh()
+    print("Project stats refreshed.")
+
+
+if __name__ == "__main__":
+    asyncio.run(refresh_project_stats())
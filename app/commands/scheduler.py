@@ -1,18 +1,33 @@
 import asyncio
+from functools import partial
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.jobstores.memory import MemoryJobStore
 from app.commands.autoclose_overdue import autoclose_overdue_tasks
-from app.db.session import SYNC_DATABASE_URL
+from app.commands.deadline_scheduler import DeadlineScheduler
+from app.commands.leader_election import LeaderElection
+from app.db.session import get_sync_engine, ASYNCPG_DSN
+from app.core.config import get_config
 
 
-async def start_scheduler() -> None:
+async def run_scheduler(persistent_jobstore: bool = True) -> None:
     """
-    Start the persistent, asynchronous scheduler for auto-closing overdue tasks.
+    Run the scheduler for auto-closing overdue tasks until cancelled.
+    With SCHEDULER_MODE=deadline (the default) tasks are closed as their deadline passes;
+    with SCHEDULER_MODE=interval the table is swept every minute, keeping the job in the
+    database (on the sync engine) unless `persistent_jobstore` is off.
     """
+    config = get_config()
+    if config.scheduler_mode == "deadline":
+        print("Deadline scheduler started – auto-closing overdue tasks as their deadlines pass.")
+        await DeadlineScheduler(config.autoclose_batch_size, config.scheduler_max_sleep).run()
+        return
 
+    # The interval job is re-added on every start, so an in-memory store loses nothing
+    jobstore = SQLAlchemyJobStore(engine=get_sync_engine()) if persistent_jobstore else MemoryJobStore()
     scheduler = AsyncIOScheduler(
         jobstores={
-            'default': SQLAlchemyJobStore(url=SYNC_DATABASE_URL)
+            'default': jobstore
         }
     )
 
@@ -20,6 +35,7 @@ async def start_scheduler() -> None:
         autoclose_overdue_tasks,
         'interval',
         minutes=1,
+        kwargs={'batch_size': config.autoclose_batch_size},
         id='autoclose_overdue',
         replace_existing=True
     )
@@ -30,9 +46,24 @@ async def start_scheduler() -> None:
     try:
         while True:
             await asyncio.sleep(3600)
-    except (KeyboardInterrupt, SystemExit):
+    finally:
         print("Scheduler shutting down...")
-        scheduler.shutdown()
+        scheduler.shutdown(wait=False)
+
+
+async def start_scheduler(persistent_jobstore: bool = True) -> None:
+    """
+    Start the persistent, asynchronous scheduler for auto-closing overdue tasks.
+    With SCHEDULER_LEADER_ELECTION on (the default) every replica may call this:
+    only the one holding the advisory lock runs the scheduler, the others stand by.
+    """
+    config = get_config()
+    job = partial(run_scheduler, persistent_jobstore)
+    if not config.scheduler_leader_election:
+        await job()
+        return
+    election = LeaderElection(ASYNCPG_DSN, config.scheduler_lock_id, config.scheduler_lease_interval)
+    await election.run(job)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Optional, Tuple
+from app.core.config import get_config
+
+
+class Cache(ABC):
+    """Async key/value cache for small dict records, with hit/miss counters."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        value = await self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    @abstractmethod
+    async def _get(self, key: Hashable) -> Optional[Dict[str, Any]]: ...
+
+    @abstractmethod
+    async def set(self, key: Hashable, value: Dict[str, Any]) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: Hashable) -> None: ...
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": type(self).__name__, "hits": self.hits, "misses": self.misses}
+
+
+class LRUTTLCache(Cache):
+    """In-process cache holding at most `maxsize` entries, each for at most `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def _get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: Hashable, value: Dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "size": len(self._entries), "maxsize": self.maxsize}
+
+
+class RedisCache(Cache):
+    """
+    Cache backed by a Redis-compatible server, shared by every process that points at it.
+    Needs the optional `redis` package.
+    """
+
+    def __init__(self, url: str, ttl: float, prefix: str) -> None:
+        super().__init__()
+        try:
+            from redis import asyncio as aioredis
+        except ImportError:
+            raise RuntimeError("The redis cache backend needs the 'redis' package (pip install redis)")
+        self._client = aioredis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def _get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        raw = await self._client.get(self._key(key))
+        if raw is None:
+            return None
+        return json.loads(raw, object_hook=_decode_datetimes)
+
+    async def set(self, key: Hashable, value: Dict[str, Any]) -> None:
+        raw = json.dumps(value, default=_encode_datetime)
+        await self._client.set(self._key(key), raw, px=int(self.ttl * 1000))
+
+    async def delete(self, key: Hashable) -> None:
+        await self._client.delete(self._key(key))
+
+
+def _encode_datetime(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode_datetimes(obj: Dict[str, Any]) -> Any:
+    if "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+@lru_cache(maxsize=None)
+def get_project_cache() -> Optional[Cache]:
+    """Process-wide project cache chosen by PROJECT_CACHE_BACKEND, or None when disabled."""
+    config = get_config()
+    if config.project_cache_backend == "memory":
+        return LRUTTLCache(config.project_cache_size, config.project_cache_ttl)
+    if config.project_cache_backend == "redis":
+        return RedisCache(config.redis_url, config.project_cache_ttl, prefix="todolist:project")
+    return None
@@ -1,13 +1,64 @@
 import os
+from functools import lru_cache
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 
 
 class Config:
-    """Configuration loader for environment variables."""
+    """Configuration loader for environment variables. Instances are read-only once loaded."""
 
     def __init__(self) -> None:
         load_dotenv()
         self.max_projects: int = int(os.getenv("MAX_NUMBER_OF_PROJECT", "10"))
         self.max_tasks: int = int(os.getenv("MAX_NUMBER_OF_TASK", "100"))
+        # 0 (the default) closes the whole overdue backlog in a single UPDATE
+        self.autoclose_batch_size: Optional[int] = int(os.getenv("AUTOCLOSE_BATCH_SIZE", "0")) or None
+        # "deadline" sleeps until the next open deadline; "interval" sweeps every minute
+        self.scheduler_mode: str = os.getenv("SCHEDULER_MODE", "deadline").lower()
+        # Longest the deadline scheduler sleeps without re-checking, in seconds
+        self.scheduler_max_sleep: float = float(os.getenv("SCHEDULER_MAX_SLEEP", "300"))
+        # Run the scheduler inside the API process (app lifespan) instead of app.commands.scheduler
+        self.scheduler_in_process: bool = os.getenv("SCHEDULER_IN_PROCESS", "false").lower() in ("1", "true", "yes")
+        # Only the replica holding this Postgres advisory lock runs the scheduler
+        self.scheduler_leader_election: bool = os.getenv("SCHEDULER_LEADER_ELECTION", "true").lower() in ("1", "true", "yes")
+        self.scheduler_lock_id: int = int(os.getenv("SCHEDULER_LOCK_ID", "727001"))
+        self.scheduler_lease_interval: float = float(os.getenv("SCHEDULER_LEASE_INTERVAL", "10"))
 
+        # Connection pool tuning, shared by the async and sync engines
+        self.db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "-1"))
+        self.db_pool_pre_ping: bool = os.getenv("DB_POOL_PRE_PING", "false").lower() in ("1", "true", "yes")
+        # asyncpg prepared-statement cache size; 0 disables it (e.g. behind pgbouncer)
+        self.db_statement_cache_size: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+
+        # Read-through cache for project lookups: "none", "memory" or "redis". "memory" is per process,
+        # so writes in one worker do not evict it in the others: only use it with a single API process.
+        self.project_cache_backend: str = os.getenv("PROJECT_CACHE_BACKEND", "none").lower()
+        self.project_cache_size: int = int(os.getenv("PROJECT_CACHE_SIZE", "1024"))
+        self.project_cache_ttl: float = float(os.getenv("PROJECT_CACHE_TTL", "60"))
+        self.redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+        # Keep per-project task counters in project_stats, updated on every task write,
+        # so GET /projects/stats is a table read instead of an aggregate over all tasks
+        self.project_stats_table: bool = os.getenv("PROJECT_STATS_TABLE", "false").lower() in ("1", "true", "yes")
+
+        # Events buffered per realtime subscriber before it is dropped as a slow consumer
+        self.events_queue_size: int = int(os.getenv("EVENTS_QUEUE_SIZE", "100"))
+        self._frozen = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"Config is read-only; cannot set '{name}'")
+        super().__setattr__(name, value)
+
+
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    """
+    Process-wide settings, loaded from the environment and .env once.
+    Also usable as a FastAPI dependency.
+    """
+    return Config()
@@ -1,6 +1,27 @@
+from sqlalchemy import BigInteger, Sequence, Text, cast, func, text
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
-    pass
\ No newline at end of file
+    pass
+
+
+# One global, monotonically increasing change counter shared by every table in the change feed
+revision_seq = Sequence("change_revision_seq", metadata=Base.metadata)
+
+
+def next_revision():
+    """SQL expression drawing the next change revision."""
+    # Literal SQL with the name inline, so the DDL default renders for any dialect (e.g. autogenerate)
+    return text(f"nextval('{revision_seq.name}')")
+
+
+def current_txid():
+    """SQL expression for the 64-bit id of the writing transaction."""
+    return cast(cast(func.pg_current_xact_id(), Text), BigInteger)
+
+
+def snapshot_xmin():
+    """SQL expression for the oldest transaction still running; every lower txid has finished."""
+    return cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger)
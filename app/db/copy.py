@@ -0,0 +1,13 @@
+from typing import Iterable, Sequence, Tuple, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def copy_records(db: AsyncSession, table: str, columns: Sequence[str],
+                       records: Iterable[Tuple[Any, ...]]) -> None:
+    """
+    Bulk-load records into a table with PostgreSQL COPY, through the asyncpg
+    connection underneath the session. Runs inside the session's current transaction.
+    """
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(table, records=records, columns=list(columns))
@@ -0,0 +1,47 @@
+import time
+from typing import Any, Dict
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Lifetime counters per engine ("async", "sync"), reported by app.db.session.get_pool_metrics
+pool_counters: Dict[str, Dict[str, Any]] = {}
+
+
+def counters_for(name: str) -> Dict[str, Any]:
+    return pool_counters.setdefault(name, {
+        "connects": 0,
+        "checkouts": 0,
+        "checkins": 0,
+        "checkout_wait_seconds": 0.0,
+        "checkout_wait_max_seconds": 0.0,
+        "checkout_timeouts": 0,
+    })
+
+
+class _TimedCheckout:
+    """
+    Pool mixin timing how long each checkout takes to obtain a connection (waiting for a
+    free one, or opening a new one), and counting checkouts that gave up after pool_timeout.
+    """
+    metrics_name = ""
+
+    def _do_get(self):
+        counters = counters_for(self.metrics_name)
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            counters["checkout_timeouts"] += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            counters["checkout_wait_seconds"] += waited
+            counters["checkout_wait_max_seconds"] = max(counters["checkout_wait_max_seconds"], waited)
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    metrics_name = "async"
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    metrics_name = "sync"
@@ -1,9 +1,13 @@
 import os
-from typing import Generator, AsyncGenerator
+from functools import lru_cache
+from typing import Any, Generator, AsyncGenerator, Dict
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from app.core.config import get_config
+from app.db.pool import TimedAsyncQueuePool, TimedQueuePool, counters_for
 
 # Load environment variables from .env
 load_dotenv()
@@ -14,6 +18,17 @@ DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
 DB_NAME = os.getenv("DB_NAME")
 
+config = get_config()
+
+# Pool settings shared by both engines
+POOL_OPTIONS = {
+    "pool_size": config.db_pool_size,
+    "max_overflow": config.db_max_overflow,
+    "pool_timeout": config.db_pool_timeout,
+    "pool_recycle": config.db_pool_recycle,
+    "pool_pre_ping": config.db_pool_pre_ping,
+}
+
 # --- ASYNCHRONOUS SETUP (for the new FastAPI API) ---
 
 # 1. Async Database URL (uses asyncpg)
@@ -25,9 +40,18 @@ if not ASYNC_DATABASE_URL:
 async_engine = create_async_engine(
     ASYNC_DATABASE_URL,
     echo=False,
-    future=True
+    future=True,
+    connect_args={
+        "prepared_statement_cache_size": config.db_statement_cache_size,
+        "statement_cache_size": config.db_statement_cache_size,
+    },
+    poolclass=TimedAsyncQueuePool,
+    **POOL_OPTIONS
 )
 
+# Plain asyncpg DSN for the dedicated connections that bypass the pool (LISTEN, advisory locks)
+ASYNCPG_DSN = async_engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
 # 3. Async Session Maker
 AsyncSessionLocal = sessionmaker(
     bind=async_engine,
@@ -54,17 +78,82 @@ SYNC_DATABASE_URL = f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{D
 if not SYNC_DATABASE_URL:
     raise RuntimeError("DATABASE_URL not set in .env file for sync connection")
 
-# 2. Sync Engine
-sync_engine = create_engine(
-    SYNC_DATABASE_URL,
-    echo=False,
-    future=True
-)
+# 2. Sync Engine and 3. Sync Session Maker ('SessionLocal') are created on first use,
+# so processes that only talk to the database asynchronously never open a psycopg2 pool.
+@lru_cache(maxsize=None)
+def get_sync_engine() -> Engine:
+    engine = create_engine(
+        SYNC_DATABASE_URL,
+        echo=False,
+        future=True,
+        poolclass=TimedQueuePool,
+        **POOL_OPTIONS
+    )
+    _track_pool("sync", engine)
+    return engine
 
-# 3. Sync Session Maker - This is the 'SessionLocal' that console.py needs!
-SessionLocal = sessionmaker(
-    bind=sync_engine,
-    class_=Session,
-    expire_on_commit=False,
-    future=True
-)
+
+@lru_cache(maxsize=None)
+def get_sync_sessionmaker() -> sessionmaker:
+    return sessionmaker(
+        bind=get_sync_engine(),
+        class_=Session,
+        expire_on_commit=False,
+        future=True
+    )
+
+
+def __getattr__(name: str):
+    # Lazy module attributes keep `from app.db.session import sync_engine, SessionLocal` working
+    if name == "sync_engine":
+        return get_sync_engine()
+    if name == "SessionLocal":
+        return get_sync_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# --- POOL METRICS ---
+
+def _track_pool(name: str, engine: Engine) -> None:
+    """Count connects, checkouts and checkins on an engine's pool."""
+    counters = counters_for(name)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        counters["connects"] += 1
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        counters["checkouts"] += 1
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        counters["checkins"] += 1
+
+
+_track_pool("async", async_engine.sync_engine)
+
+
+def get_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Snapshot of the connection pools: configured size, connections currently
+    checked out, overflow in use, lifetime connect/checkout/checkin counts, and how long
+    checkouts waited for a connection (total and worst, in seconds) and how many timed out.
+    The sync pool is only reported once something has created it.
+    Growing wait time or any timeouts mean the pool is too small for the load.
+    """
+    metrics = {}
+    engines = [("async", async_engine.sync_engine)]
+    if get_sync_engine.cache_info().currsize:
+        engines.append(("sync", get_sync_engine()))
+    for name, engine in engines:
+        pool = engine.pool
+        metrics[name] = {
+            "size": pool.size(),
+            "max_overflow": config.db_max_overflow,
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            **counters_for(name),
+        }
+    return metrics
@@ -1,13 +1,38 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from app.api.routers import api_router
 from app.exceptions.base import TodoListError
+from app.db.session import get_pool_metrics
+from app.core.cache import get_project_cache
+from app.realtime.broker import get_event_broker
+from app.core.config import get_config
+from app.commands.scheduler import start_scheduler
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup/shutdown. With SCHEDULER_IN_PROCESS on, the auto-close scheduler
+    runs as a background task on the app's event loop and async engine, with an in-memory
+    job store. On exit it is cancelled and the realtime LISTEN connection is closed.
+    """
+    scheduler_task = None
+    if get_config().scheduler_in_process:
+        scheduler_task = asyncio.create_task(start_scheduler(persistent_jobstore=False))
+    yield
+    if scheduler_task is not None:
+        scheduler_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await scheduler_task
+    await get_event_broker().close()
 
 # Create the FastAPI application
 app = FastAPI(
     title="ToDoList API",
     description="A complete Web API for managing projects and tasks.",
-    version="3.0.0"
+    version="3.0.0",
+    lifespan=lifespan
 )
 
 # Add a custom exception handler for all TodoListError subclasses
@@ -50,3 +75,18 @@ async def read_root():
         "message": "Welcome to the ToDoList API!",
         "documentation": "/docs"
     }
+
+@app.get("/metrics/db-pool", tags=["Monitoring"])
+async def db_pool_metrics():
+    """
+    Connection pool usage for the async (API) and sync engines.
+    """
+    return get_pool_metrics()
+
+@app.get("/metrics/project-cache", tags=["Monitoring"])
+async def project_cache_metrics():
+    """
+    Hit/miss counters of the project lookup cache.
+    """
+    cache = get_project_cache()
+    return cache.stats() if cache else {"backend": None}
@@ -1,8 +1,12 @@
 from .project import Project
 from .task import Task, TaskStatus
+from .tombstone import Tombstone
+from .project_stats import ProjectStats
 
 __all__ = [
     "Project",
     "Task",
     "TaskStatus",
+    "Tombstone",
+    "ProjectStats",
 ]
\ No newline at end of file
@@ -1,8 +1,8 @@
 from typing import List, Optional
-from sqlalchemy import String, DateTime
+from sqlalchemy import BigInteger, String, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
-from app.db.base import Base
+from app.db.base import Base, current_txid, next_revision
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,6 +10,16 @@ if TYPE_CHECKING:
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Keyset pagination of the project listing (list_all)
+        Index("ix_projects_created_at", "created_at", "id"),
+        # Version signal (max(updated_at), count) behind listing ETags
+        Index("ix_projects_updated_at", "updated_at"),
+        # Change feed (GET /changes?since=), in commit-safe (txid, revision) order
+        Index("ix_projects_txid_revision", "txid", "revision"),
+    )
+    # Fetch the server-drawn revision in the INSERT/UPDATE's RETURNING clause
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
@@ -17,6 +27,15 @@ class Project(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+    revision: Mapped[int] = mapped_column(
+        BigInteger, server_default=next_revision(), onupdate=next_revision(), nullable=False
+    )
+    txid: Mapped[int] = mapped_column(
+        BigInteger, server_default=current_txid(), onupdate=current_txid(), nullable=False
+    )
 
     # One-to-many relationship
     tasks: Mapped[List["Task"]] = relationship(
@@ -0,0 +1,25 @@
+from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from app.db.base import Base
+
+
+class ProjectStats(Base):
+    """
+    Per-project task counters by status, kept up to date by task mutations when
+    PROJECT_STATS_TABLE is enabled. Overdue counts are time-dependent and are not stored.
+    """
+    __tablename__ = "project_stats"
+
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    todo: Mapped[int] = mapped_column(default=0, nullable=False)
+    doing: Mapped[int] = mapped_column(default=0, nullable=False)
+    done: Mapped[int] = mapped_column(default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<ProjectStats {self.project_id}: {self.todo}/{self.doing}/{self.done}>"
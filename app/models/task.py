@@ -1,9 +1,9 @@
 import enum
 from typing import Optional
-from sqlalchemy import String, DateTime, ForeignKey
+from sqlalchemy import BigInteger, String, DateTime, ForeignKey, Index, literal_column, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
-from app.db.base import Base
+from app.db.base import Base, current_txid, next_revision
 from enum import Enum
 from typing import TYPE_CHECKING
 
@@ -16,8 +16,32 @@ class TaskStatus(enum.Enum):
     DONE = "done"
 
 
+# Full-text document of a task. Spelled out as literal SQL (no bound parameters) so queries
+# compare against exactly the expression indexed by ix_tasks_search.
+TASK_SEARCH_DOCUMENT = literal_column(
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+)
+
+
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination of a project's tasks (list_by_project)
+        Index("ix_tasks_project_id_created_at", "project_id", "created_at", "id"),
+        # Task listing filtered by status / sorted by deadline
+        Index("ix_tasks_project_id_status", "project_id", "status", "created_at", "id"),
+        Index("ix_tasks_project_id_deadline", "project_id", "deadline", "id"),
+        # Overdue sweep only ever looks at tasks that are still open
+        Index("ix_tasks_open_deadline", "deadline", postgresql_where=text("status != 'DONE'")),
+        # Version signal (max(updated_at), count) behind listing ETags
+        Index("ix_tasks_project_id_updated_at", "project_id", "updated_at"),
+        # Change feed (GET /changes?since=), in commit-safe (txid, revision) order
+        Index("ix_tasks_txid_revision", "txid", "revision"),
+        # Full-text search over title and description (GET /tasks/search)
+        Index("ix_tasks_search", TASK_SEARCH_DOCUMENT, postgresql_using="gin"),
+    )
+    # Fetch the server-drawn revision in the INSERT/UPDATE's RETURNING clause
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
@@ -28,6 +52,15 @@ class Task(Base):
         DateTime, default=datetime.utcnow, nullable=False
     )
     closed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+    revision: Mapped[int] = mapped_column(
+        BigInteger, server_default=next_revision(), onupdate=next_revision(), nullable=False
+    )
+    txid: Mapped[int] = mapped_column(
+        BigInteger, server_default=current_txid(), onupdate=current_txid(), nullable=False
+    )
 
     # Foreign key + relationship
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), nullable=False)
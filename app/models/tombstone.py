@@ -0,0 +1,31 @@
+from typing import Optional
+from sqlalchemy import BigInteger, String, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from app.db.base import Base, current_txid, next_revision
+
+
+class Tombstone(Base):
+    """Record of a deleted project or task, so the change feed can report deletions."""
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        Index("ix_tombstones_txid_revision", "txid", "revision"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    entity: Mapped[str] = mapped_column(String, nullable=False)  # "project" or "task"
+    entity_id: Mapped[int] = mapped_column(nullable=False)
+    project_id: Mapped[Optional[int]] = mapped_column(nullable=True)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    revision: Mapped[int] = mapped_column(
+        BigInteger, server_default=next_revision(), nullable=False
+    )
+    txid: Mapped[int] = mapped_column(
+        BigInteger, server_default=current_txid(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<Tombstone {self.entity} {self.entity_id}>"
@@ -0,0 +1,4 @@
+from .events import EVENTS_CHANNEL
+from .broker import EventBroker, Subscriber, get_event_broker
+
+__all__ = ["EVENTS_CHANNEL", "EventBroker", "Subscriber", "get_event_broker"]
@@ -0,0 +1,96 @@
+import asyncio
+import json
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set
+import asyncpg
+from app.core.config import get_config
+from app.db.session import ASYNCPG_DSN
+from .events import EVENTS_CHANNEL
+
+
+class Subscriber:
+    """One connected client: a bounded queue of events, optionally filtered to a project."""
+
+    def __init__(self, project_id: Optional[int], maxsize: int) -> None:
+        self.project_id = project_id
+        self.queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue(maxsize=maxsize)
+        self.dropped = False
+
+    def wants(self, event: Dict[str, Any]) -> bool:
+        return self.project_id is None or event.get("project_id") == self.project_id
+
+    async def next_event(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait for the next event; None on timeout or once the subscriber has been dropped."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBroker:
+    """
+    Holds a single asyncpg LISTEN connection per process and fans NOTIFY events out to
+    subscribers. A subscriber whose queue is full is dropped instead of slowing the others.
+    When the LISTEN connection is lost every subscriber is dropped, since events sent in the
+    meantime are gone; the next subscribe() reconnects.
+    """
+
+    def __init__(self, dsn: str, queue_size: int) -> None:
+        self.dsn = dsn
+        self.queue_size = queue_size
+        self.subscribers: Set[Subscriber] = set()
+        self._connection: Optional[asyncpg.Connection] = None
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, project_id: Optional[int] = None) -> Subscriber:
+        await self._ensure_listening()
+        subscriber = Subscriber(project_id, self.queue_size)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self.subscribers.discard(subscriber)
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    async def _ensure_listening(self) -> None:
+        async with self._lock:
+            if self._connection is None or self._connection.is_closed():
+                connection = await asyncpg.connect(self.dsn)
+                await connection.add_listener(EVENTS_CHANNEL, self._on_notify)
+                connection.add_termination_listener(self._on_terminated)
+                self._connection = connection
+
+    def _on_terminated(self, connection: Any) -> None:
+        """The LISTEN connection closed: drop every subscriber so clients reconnect and re-sync."""
+        if connection is self._connection:
+            self._connection = None
+        for subscriber in list(self.subscribers):
+            self._drop(subscriber)
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        event = json.loads(payload)
+        for subscriber in list(self.subscribers):
+            if not subscriber.wants(event):
+                continue
+            try:
+                subscriber.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._drop(subscriber)
+
+    def _drop(self, subscriber: Subscriber) -> None:
+        """Disconnect a subscriber: discard its backlog and wake it with the end-of-stream marker."""
+        self.subscribers.discard(subscriber)
+        subscriber.dropped = True
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(None)
+
+
+@lru_cache(maxsize=None)
+def get_event_broker() -> EventBroker:
+    """Process-wide broker, listening on the same database as the async engine."""
+    return EventBroker(ASYNCPG_DSN, get_config().events_queue_size)
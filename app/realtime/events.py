@@ -0,0 +1,14 @@
+"""
+Change events are emitted by the database itself: statement-level triggers on projects and
+tasks (migration b2e6d4f81c37) call pg_notify in the writing transaction, so an event is
+delivered exactly when, and only if, the change commits.
+
+Each payload is JSON: {"entity": "project" | "task", "action": "created" | "updated" | "deleted",
+"project_id": ..., "ids": [...]}.
+"""
+
+# Postgres NOTIFY channel carrying project/task change events
+EVENTS_CHANNEL = "todolist_events"
+
+# NOTIFY payloads must stay below 8000 bytes; bulk changes are split into several events
+MAX_IDS_PER_EVENT = 500
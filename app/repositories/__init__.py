@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy.engine import Row
 from app.models.project import Project
 from app.models.task import Task, TaskStatus
+from app.models.tombstone import Tombstone
 from datetime import datetime
 
 class ProjectRepository(ABC):
@@ -11,6 +13,18 @@ class ProjectRepository(ABC):
     @abstractmethod
     def get(self, project_id: int) -> Project: ...
 
+    @abstractmethod
+    def get_fields(self, project_id: int, fields: Sequence[str]) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    def task_rows(self, project_id: int) -> List[Row]: ...
+
+    @abstractmethod
+    def ids_by_name(self, names: Iterable[str]) -> Dict[str, int]: ...
+
+    @abstractmethod
+    def copy_rows(self, records: List[Tuple[Any, ...]]) -> int: ...
+
     @abstractmethod
     def update(self, project: Project) -> Project: ...
 
@@ -18,16 +32,41 @@ class ProjectRepository(ABC):
     def delete(self, project_id: int) -> None: ...
 
     @abstractmethod
-    def list_all(self) -> List[Project]: ...
+    def list_all(self, limit: Optional[int] = None,
+                 after: Optional[Tuple[datetime, int]] = None) -> List[Row]: ...
+
+    @abstractmethod
+    def version(self) -> Tuple[Optional[datetime], int]: ...
+
+    @abstractmethod
+    def count(self) -> int: ...
+
+    @abstractmethod
+    def stream_rows(self, partition_size: int = 1000) -> AsyncIterator[Sequence[Row]]: ...
 
 class TaskRepository(ABC):
     @abstractmethod
     def create(self, project: Project, title: str, description: str | None = None,
                status: TaskStatus = TaskStatus.TODO, deadline: datetime | None = None) -> Task: ...
 
+    @abstractmethod
+    def create_if_below_limit(self, project: Project, limit: int, title: str, description: str | None = None,
+                              status: TaskStatus = TaskStatus.TODO,
+                              deadline: datetime | None = None) -> Optional[Task]: ...
+
+    @abstractmethod
+    def create_many_if_below_limit(self, project: Project, limit: int,
+                                   rows: List[Dict[str, Any]]) -> Optional[List[Task]]: ...
+
+    @abstractmethod
+    def copy_rows(self, records: List[Tuple[Any, ...]]) -> int: ...
+
     @abstractmethod
     def get(self, task_id: int) -> Task: ...
 
+    @abstractmethod
+    def get_in_project(self, project_id: int, task_id: int) -> Task: ...
+
     @abstractmethod
     def update(self, task: Task) -> Task: ...
 
@@ -35,7 +74,57 @@ class TaskRepository(ABC):
     def delete(self, task_id: int) -> None: ...
 
     @abstractmethod
-    def list_by_project(self, project: Project) -> List[Task]: ...
+    def list_by_project(self, project: Project, limit: Optional[int] = None,
+                        after: Optional[Tuple[Optional[datetime], int]] = None,
+                        statuses: Optional[List[TaskStatus]] = None,
+                        deadline_from: Optional[datetime] = None, deadline_to: Optional[datetime] = None,
+                        closed: Optional[bool] = None, sort: str = "created_at") -> List[Row]: ...
+
+    @abstractmethod
+    def search(self, query: str, project_id: Optional[int] = None,
+               limit: int = 20, offset: int = 0) -> List[Tuple[Task, float]]: ...
+
+    @abstractmethod
+    def set_status_many(self, project: Project, task_ids: List[int], status: TaskStatus) -> List[Task]: ...
+
+    @abstractmethod
+    def version_by_project(self, project: Project) -> Tuple[Optional[datetime], int]: ...
+
+    @abstractmethod
+    def count_by_project(self, project: Project) -> int: ...
 
     @abstractmethod
     def get_overdue_tasks(self) -> List[Task]: ...
+
+    @abstractmethod
+    def next_open_deadline(self) -> Optional[datetime]: ...
+
+    @abstractmethod
+    def close_overdue_tasks(self, batch_size: Optional[int] = None) -> List[Tuple[int, int]]: ...
+
+    @abstractmethod
+    def stream_rows(self, project_id: Optional[int] = None,
+                    partition_size: int = 1000) -> AsyncIterator[Sequence[Row]]: ...
+
+class ChangeRepository(ABC):
+    @abstractmethod
+    def high_water(self) -> int: ...
+
+    @abstractmethod
+    def projects_since(self, position: Tuple[int, int], high_water: int, limit: int) -> List[Project]: ...
+
+    @abstractmethod
+    def tasks_since(self, position: Tuple[int, int], high_water: int, limit: int) -> List[Task]: ...
+
+    @abstractmethod
+    def tombstones_since(self, position: Tuple[int, int], high_water: int, limit: int) -> List[Tombstone]: ...
+
+class ProjectStatsRepository(ABC):
+    @abstractmethod
+    def aggregate(self) -> List[Row]: ...
+
+    @abstractmethod
+    def stored(self) -> List[Row]: ...
+
+    @abstractmethod
+    def refresh(self, project_ids: Optional[Iterable[int]] = None) -> None: ...
@@ -0,0 +1,53 @@
+from typing import Any, Dict, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from app.models.project import Project
+from app.core.cache import Cache
+from .project_repository import SQLAlchemyProjectRepository
+
+
+class CachedProjectRepository(SQLAlchemyProjectRepository):
+    """
+    Project repository with a read-through cache in front of `get`.
+    A cache hit is attached to the session with merge(load=False), so callers get a
+    regular persistent instance without a SELECT. `update` and `delete` invalidate the entry.
+    """
+
+    def __init__(self, db: AsyncSession, cache: Cache):
+        super().__init__(db)
+        self.cache = cache
+
+    async def get(self, project_id: int) -> Project:
+        data = await self.cache.get(project_id)
+        if data is not None:
+            project = Project(**data)
+            make_transient_to_detached(project)
+            return await self.db.merge(project, load=False)
+        project = await super().get(project_id)
+        await self.cache.set(project_id, {
+            "id": project.id,
+            "name": project.name,
+            "description": project.description,
+            "created_at": project.created_at,
+            "updated_at": project.updated_at,
+        })
+        return project
+
+    async def get_fields(self, project_id: int, fields: Sequence[str]) -> Dict[str, Any]:
+        # Every projectable column is in the cached entry, so a warm cache answers without a query
+        project = await self.get(project_id)
+        return {field: getattr(project, field) for field in fields}
+
+    async def update(self, project: Project) -> Project:
+        project_id = project.id
+        try:
+            project = await super().update(project)
+        finally:
+            await self.cache.delete(project_id)
+        return project
+
+    async def delete(self, project_id: int) -> None:
+        try:
+            await super().delete(project_id)
+        finally:
+            await self.cache.delete(project_id)
@@ -0,0 +1,54 @@
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.db.base import snapshot_xmin
+from app.models.project import Project
+from app.models.task import Task
+from app.models.tombstone import Tombstone
+from typing import List, Tuple
+from . import ChangeRepository
+
+
+class SQLAlchemyChangeRepository(ChangeRepository):
+    """
+    Reads rows changed after a (txid, revision) position, in that order, using the
+    (txid, revision) indexes. Only rows written by transactions below `high_water` are
+    returned: those have all finished, so no row can later commit behind the cursor.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def high_water(self) -> int:
+        result = await self.db.execute(select(snapshot_xmin()))
+        return result.scalar_one()
+
+    async def projects_since(self, position: Tuple[int, int], high_water: int, limit: int) -> List[Project]:
+        stmt = (
+            select(Project)
+            .where(tuple_(Project.txid, Project.revision) > position, Project.txid < high_water)
+            .order_by(Project.txid, Project.revision)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def tasks_since(self, position: Tuple[int, int], high_water: int, limit: int) -> List[Task]:
+        stmt = (
+            select(Task)
+            .where(tuple_(Task.txid, Task.revision) > position, Task.txid < high_water)
+            .order_by(Task.txid, Task.revision)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def tombstones_since(self, position: Tuple[int, int], high_water: int, limit: int) -> List[Tombstone]:
+        stmt = (
+            select(Tombstone)
+            .where(tuple_(Tombstone.txid, Tombstone.revision) > position, Tombstone.txid < high_water)
+            .order_by(Tombstone.txid, Tombstone.revision)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
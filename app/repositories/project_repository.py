@@ -1,11 +1,24 @@
+from sqlalchemy import func, insert, literal, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.exc import StaleDataError
 from app.models.project import Project
+from app.models.task import Task
+from app.repositories.task_repository import TASK_ROW_COLUMNS
+from app.models.tombstone import Tombstone
+from app.db.copy import copy_records
 from app.exceptions.repository_exceptions import ProjectNotFoundError
-from typing import List
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy.engine import Row
+from datetime import datetime
 from . import ProjectRepository
 
+# Project columns GET /projects/{id} can be projected onto
+PROJECT_FIELDS = ("id", "name", "description", "created_at", "updated_at")
+
+# A project as the API returns it; the listing reads these columns as plain rows
+PROJECT_ROW_COLUMNS = tuple(getattr(Project, field) for field in PROJECT_FIELDS)
+
 
 class SQLAlchemyProjectRepository(ProjectRepository):
     def __init__(self, db: AsyncSession):
@@ -14,8 +27,9 @@ class SQLAlchemyProjectRepository(ProjectRepository):
     async def create(self, name: str, description: str | None = None) -> Project:
         project = Project(name=name, description=description)
         self.db.add(project)
+        # The flush emits INSERT ... RETURNING id and created_at is set client-side,
+        # so with expire_on_commit=False the instance is complete without a refresh.
         await self.db.commit()
-        await self.db.refresh(project)
         return project
 
     async def get(self, project_id: int) -> Project:
@@ -26,35 +40,90 @@ class SQLAlchemyProjectRepository(ProjectRepository):
             raise ProjectNotFoundError(f"Project with ID {project_id} not found")
         return project
 
-    async def get_with_tasks(self, project_id: int) -> Project:
-        stmt = select(Project).where(Project.id == project_id).options(selectinload(Project.tasks))
+    async def get_fields(self, project_id: int, fields: Sequence[str]) -> Dict[str, Any]:
+        """Select only the given columns of a project, as a {field: value} dict."""
+        stmt = select(*(getattr(Project, field) for field in fields)).where(Project.id == project_id)
         result = await self.db.execute(stmt)
-        project = result.scalar_one_or_none()
-        if not project:
+        row = result.one_or_none()
+        if row is None:
             raise ProjectNotFoundError(f"Project with ID {project_id} not found")
-        return project
+        return dict(row._mapping)
+
+    async def task_rows(self, project_id: int) -> List[Row]:
+        """The tasks of a project as plain rows in (created_at, id) order, without loading the relationship."""
+        stmt = select(*TASK_ROW_COLUMNS).where(Task.project_id == project_id).order_by(Task.created_at, Task.id)
+        result = await self.db.execute(stmt)
+        return list(result.all())
 
     async def get_by_name(self, name: str) -> Project | None:
         stmt = select(Project).where(Project.name == name)
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def update(self, project: Project) -> Project:
+    async def ids_by_name(self, names: Iterable[str]) -> Dict[str, int]:
+        """Map the given project names to their IDs; unknown names are left out."""
+        stmt = select(Project.name, Project.id).where(Project.name.in_(set(names)))
+        result = await self.db.execute(stmt)
+        return {name: project_id for name, project_id in result.all()}
+
+    async def copy_rows(self, records: List[Tuple[Any, ...]]) -> int:
+        """Bulk-load (name, description, created_at, updated_at) records with COPY and commit them."""
+        columns = ("name", "description", "created_at", "updated_at")
+        await copy_records(self.db, Project.__tablename__, columns, records)
         await self.db.commit()
-        await self.db.refresh(project)
+        return len(records)
+
+    async def update(self, project: Project) -> Project:
+        project_id = project.id
+        try:
+            await self.db.commit()
+        except StaleDataError:
+            # The row was deleted after the caller loaded it (e.g. from a cached copy)
+            await self.db.rollback()
+            raise ProjectNotFoundError(f"Project with ID {project_id} not found")
         return project
 
     async def delete(self, project_id: int) -> None:
-        project = await self.get(project_id)
+        # Always read the row itself: a cached copy may outlive a project deleted elsewhere
+        project = await SQLAlchemyProjectRepository.get(self, project_id)
+        # Leave tombstones for the project and each of its tasks for the change feed
+        task_tombstones = insert(Tombstone).from_select(
+            ["entity", "entity_id", "project_id", "deleted_at"],
+            select(literal("task"), Task.id, Task.project_id, literal(datetime.utcnow())).where(Task.project_id == project_id)
+        )
+        await self.db.execute(task_tombstones)
+        self.db.add(Tombstone(entity="project", entity_id=project_id, project_id=project_id))
         await self.db.delete(project)
         await self.db.commit()
 
-    async def list_all(self) -> List[Project]:
-        stmt = select(Project).order_by(Project.created_at)
+    async def list_all(self, limit: Optional[int] = None,
+                       after: Optional[Tuple[datetime, int]] = None) -> List[Row]:
+        """
+        List projects as plain rows of PROJECT_ROW_COLUMNS in (created_at, id) order,
+        one keyset page at a time when `limit` is given.
+        """
+        stmt = select(*PROJECT_ROW_COLUMNS).order_by(Project.created_at, Project.id)
+        if after is not None:
+            stmt = stmt.where(tuple_(Project.created_at, Project.id) > tuple_(*after))
+        if limit is not None:
+            stmt = stmt.limit(limit)
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.all())
+
+    async def version(self) -> Tuple[Optional[datetime], int]:
+        """Cheap change signal for the project table: (max(updated_at), count(*))."""
+        result = await self.db.execute(select(func.max(Project.updated_at), func.count()).select_from(Project))
+        last_modified, count = result.one()
+        return last_modified, count
 
     async def count(self) -> int:
-        # A more efficient way to count
-        result = await self.db.execute(select(Project))
-        return len(result.scalars().all())
+        """Count projects with a SELECT count(*) instead of loading every row."""
+        result = await self.db.execute(select(func.count()).select_from(Project))
+        return result.scalar_one()
+
+    async def stream_rows(self, partition_size: int = 1000) -> AsyncIterator[Sequence[Row]]:
+        """Stream plain project rows through a server-side cursor, `partition_size` rows at a time."""
+        stmt = select(Project.id, Project.name, Project.description, Project.created_at).order_by(Project.id)
+        result = await self.db.stream(stmt.execution_options(yield_per=partition_size))
+        async for partition in result.partitions():
+            yield partition
@@ -0,0 +1,101 @@
+from sqlalchemy import func, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.models.project import Project
+from app.models.project_stats import ProjectStats
+from app.models.task import Task, TaskStatus
+from app.repositories.task_repository import OPEN_TASK
+from typing import Iterable, List, Optional
+from sqlalchemy.engine import Row
+from datetime import datetime
+from . import ProjectStatsRepository
+
+
+def _status_counts() -> list:
+    """count(*) FILTER (WHERE status = ...) per task status, labelled todo / doing / done."""
+    return [func.count(Task.id).filter(Task.status == status).label(status.value) for status in TaskStatus]
+
+
+class SQLAlchemyProjectStatsRepository(ProjectStatsRepository):
+    """
+    Per-project task counts, either aggregated live from the tasks table or read
+    from the project_stats counters. Rows are (project_id, name, todo, doing, done, overdue).
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def aggregate(self) -> List[Row]:
+        """Asynchronously counts every project's tasks by status in one grouped query."""
+        overdue = func.count(Task.id).filter(Task.deadline < datetime.utcnow(), OPEN_TASK).label("overdue")
+        stmt = (
+            select(Project.id.label("project_id"), Project.name, *_status_counts(), overdue)
+            .select_from(Project)
+            .outerjoin(Task, Task.project_id == Project.id)
+            .group_by(Project.id)
+            .order_by(Project.id)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    async def stored(self) -> List[Row]:
+        """
+        Asynchronously reads the stored counters. Overdue tasks are still counted live,
+        but only through the partial index on open deadlines.
+        """
+        overdue = (
+            select(Task.project_id, func.count().label("overdue"))
+            .where(Task.deadline < datetime.utcnow(), OPEN_TASK)
+            .group_by(Task.project_id)
+            .subquery()
+        )
+        stmt = (
+            select(
+                Project.id.label("project_id"),
+                Project.name,
+                func.coalesce(ProjectStats.todo, 0).label("todo"),
+                func.coalesce(ProjectStats.doing, 0).label("doing"),
+                func.coalesce(ProjectStats.done, 0).label("done"),
+                func.coalesce(overdue.c.overdue, 0).label("overdue"),
+            )
+            .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+            .outerjoin(overdue, overdue.c.project_id == Project.id)
+            .order_by(Project.id)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    async def refresh(self, project_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        Asynchronously recounts the tasks of the given projects (all when None) and upserts
+        their counters. Recounting, rather than applying deltas, keeps the table self-healing.
+        """
+        lock = select(Project.id).order_by(Project.id).with_for_update(key_share=True)
+        counts = (
+            select(Project.id, *_status_counts(), literal(datetime.utcnow()))
+            .select_from(Project)
+            .outerjoin(Task, Task.project_id == Project.id)
+            .group_by(Project.id)
+        )
+        if project_ids is not None:
+            ids = sorted(set(project_ids))
+            if not ids:
+                return
+            lock = lock.where(Project.id.in_(ids))
+            counts = counts.where(Project.id.in_(ids))
+        # Serialize refreshes of a project, so a recount that started before a concurrent
+        # one cannot overwrite its newer result. The upsert below then sees every committed task.
+        await self.db.execute(lock)
+        stmt = insert(ProjectStats).from_select(["project_id", "todo", "doing", "done", "updated_at"], counts)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProjectStats.project_id],
+            set_={
+                "todo": stmt.excluded.todo,
+                "doing": stmt.excluded.doing,
+                "done": stmt.excluded.done,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
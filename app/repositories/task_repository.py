@@ -1,12 +1,41 @@
+from sqlalchemy import and_, case, func, insert, or_, text, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from app.models.task import Task, TaskStatus
+from app.models.task import Task, TaskStatus, TASK_SEARCH_DOCUMENT
 from app.models.project import Project
-from app.exceptions.repository_exceptions import TaskNotFoundError
-from typing import List
+from app.models.tombstone import Tombstone
+from app.db.copy import copy_records
+from app.exceptions.repository_exceptions import ProjectNotFoundError, TaskNotFoundError
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy.engine import Row
 from datetime import datetime
 from . import TaskRepository
 
+# Written as literal SQL (not a bound parameter) so the planner can match the
+# partial index ix_tasks_open_deadline, whose predicate is the same expression.
+OPEN_TASK = text("tasks.status != 'DONE'")
+
+# A task as the API returns it; listings read these columns as plain rows, not ORM instances
+TASK_ROW_COLUMNS = (
+    Task.id, Task.title, Task.description, Task.status, Task.deadline,
+    Task.created_at, Task.updated_at, Task.closed_at, Task.project_id,
+)
+
+# Sort keys accepted by list_by_project; each is backed by a (project_id, key, id) index
+SORT_KEYS = {
+    "created_at": Task.created_at,
+    "deadline": Task.deadline,
+}
+
+def _after_key(key, value: Optional[datetime], task_id: int):
+    """Keyset predicate for rows after (value, task_id) in (key NULLS LAST, id) order."""
+    if value is None:
+        return and_(key.is_(None), Task.id > task_id)
+    after = tuple_(key, Task.id) > tuple_(value, task_id)
+    if key.expression.nullable:
+        return or_(after, key.is_(None))
+    return after
+
 class SQLAlchemyTaskRepository(TaskRepository):
     def __init__(self, db: AsyncSession):
         """The repository now expects an AsyncSession."""
@@ -23,10 +52,66 @@ class SQLAlchemyTaskRepository(TaskRepository):
             project_id=project.id
         )
         self.db.add(task)
+        # The flush emits INSERT ... RETURNING id and the other defaults are set client-side,
+        # so with expire_on_commit=False the instance is complete without a refresh.
         await self.db.commit()
-        await self.db.refresh(task)
         return task
 
+    async def create_if_below_limit(self, project: Project, limit: int, title: str,
+                                    description: str | None = None, status: TaskStatus = TaskStatus.TODO,
+                                    deadline: datetime | None = None) -> Optional[Task]:
+        """
+        Asynchronously creates a task only if the project holds fewer than `limit` tasks.
+        The project row is locked for the rest of the transaction so concurrent
+        creates are serialized. Returns None when the limit has been reached.
+        """
+        await self._lock_project(project)
+        if await self.count_by_project(project) >= limit:
+            await self.db.rollback()  # Release the row lock
+            return None
+        return await self.create(project, title, description, status, deadline)
+
+    async def create_many_if_below_limit(self, project: Project, limit: int,
+                                         rows: List[Dict[str, Any]]) -> Optional[List[Task]]:
+        """
+        Asynchronously inserts several tasks with one multi-row INSERT ... RETURNING.
+        Each row holds the `title`, `description`, `status` and `deadline` of a task.
+        The whole batch is rejected (None) if it would take the project past `limit` tasks.
+        """
+        if not rows:
+            return []
+        await self._lock_project(project)
+        if await self.count_by_project(project) + len(rows) > limit:
+            await self.db.rollback()  # Release the row lock
+            return None
+        stmt = insert(Task).returning(Task)
+        result = await self.db.scalars(stmt, [{**row, "project_id": project.id} for row in rows])
+        tasks = list(result.all())
+        await self.db.commit()
+        return tasks
+
+    async def copy_rows(self, records: List[Tuple[Any, ...]]) -> int:
+        """
+        Asynchronously bulk-loads tasks with COPY and commits them. Each record is
+        (title, description, status name, deadline, created_at, closed_at, updated_at, project_id).
+        """
+        columns = ("title", "description", "status", "deadline", "created_at", "closed_at", "updated_at", "project_id")
+        await copy_records(self.db, Task.__tablename__, columns, records)
+        await self.db.commit()
+        return len(records)
+
+    async def _lock_project(self, project: Project) -> None:
+        """
+        Lock the project row until the end of the transaction to serialize task creation.
+        Also confirms the row still exists, as the caller's copy may come from a cache.
+        """
+        project_id = project.id
+        stmt = select(Project.id).where(Project.id == project_id).with_for_update()
+        result = await self.db.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            await self.db.rollback()
+            raise ProjectNotFoundError(f"Project with ID {project_id} not found")
+
     async def get(self, task_id: int) -> Task:
         """Asynchronously retrieves a task by its ID."""
         stmt = select(Task).where(Task.id == task_id)
@@ -36,27 +121,176 @@ class SQLAlchemyTaskRepository(TaskRepository):
             raise TaskNotFoundError(f"Task with ID {task_id} not found")
         return task
 
+    async def get_in_project(self, project_id: int, task_id: int) -> Task:
+        """
+        Asynchronously retrieves a task together with an existence check of its project,
+        in a single round trip (projects LEFT JOIN tasks).
+        The task is returned even if it belongs to another project; callers check ownership.
+        """
+        stmt = (
+            select(Project.id, Task)
+            .select_from(Project)
+            .outerjoin(Task, Task.id == task_id)
+            .where(Project.id == project_id)
+        )
+        result = await self.db.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            raise ProjectNotFoundError(f"Project with ID {project_id} not found")
+        if row.Task is None:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+        return row.Task
+
     async def update(self, task: Task) -> Task:
-        """Asynchronously commits changes to a task."""
+        """Asynchronously commits changes to a task. The instance already holds the new values."""
         await self.db.commit()
-        await self.db.refresh(task)
         return task
 
     async def delete(self, task_id: int) -> None:
         """Asynchronously deletes a task."""
-        task = await self.get(task_id) # Must await the get method
+        # Session.get() reuses an instance already loaded by the caller instead of re-selecting it
+        task = await self.db.get(Task, task_id)
+        if not task:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+        self.db.add(Tombstone(entity="task", entity_id=task.id, project_id=task.project_id))
         await self.db.delete(task)
         await self.db.commit()
 
-    async def list_by_project(self, project: Project) -> List[Task]:
-        """Asynchronously lists all tasks for a given project."""
-        stmt = select(Task).where(Task.project_id == project.id).order_by(Task.created_at)
+    async def list_by_project(self, project: Project, limit: Optional[int] = None,
+                              after: Optional[Tuple[Optional[datetime], int]] = None,
+                              statuses: Optional[List[TaskStatus]] = None,
+                              deadline_from: Optional[datetime] = None, deadline_to: Optional[datetime] = None,
+                              closed: Optional[bool] = None, sort: str = "created_at") -> List[Row]:
+        """
+        Asynchronously lists the tasks of a project matching the given filters, as plain rows
+        of TASK_ROW_COLUMNS, in (`sort`, id) order with tasks lacking a deadline last when sorting by deadline.
+        When `limit` is given only one keyset page is returned, starting after the `after` key.
+        """
+        key = SORT_KEYS[sort]
+        stmt = select(*TASK_ROW_COLUMNS).where(Task.project_id == project.id)
+        if statuses:
+            stmt = stmt.where(Task.status.in_(statuses))
+        if deadline_from is not None:
+            stmt = stmt.where(Task.deadline >= deadline_from)
+        if deadline_to is not None:
+            stmt = stmt.where(Task.deadline <= deadline_to)
+        if closed is not None:
+            stmt = stmt.where(Task.closed_at.is_not(None) if closed else Task.closed_at.is_(None))
+        if after is not None:
+            stmt = stmt.where(_after_key(key, *after))
+        stmt = stmt.order_by(key.asc().nulls_last(), Task.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.all())
+
+    async def search(self, query: str, project_id: Optional[int] = None,
+                     limit: int = 20, offset: int = 0) -> List[Tuple[Task, float]]:
+        """
+        Asynchronously full-text searches task titles and descriptions (web-search syntax),
+        best matches first. Returns (task, rank) pairs.
+        """
+        ts_query = func.websearch_to_tsquery("english", query)
+        rank = func.ts_rank(TASK_SEARCH_DOCUMENT, ts_query).label("rank")
+        stmt = select(Task, rank).where(TASK_SEARCH_DOCUMENT.op("@@")(ts_query))
+        if project_id is not None:
+            stmt = stmt.where(Task.project_id == project_id)
+        stmt = stmt.order_by(rank.desc(), Task.id).limit(limit).offset(offset)
+        result = await self.db.execute(stmt)
+        return [(task, task_rank) for task, task_rank in result.all()]
+
+    async def set_status_many(self, project: Project, task_ids: List[int], status: TaskStatus) -> List[Task]:
+        """
+        Asynchronously sets the status of several tasks of a project with one UPDATE ... RETURNING.
+        Moving to DONE stamps closed_at unless already set; any other status clears it.
+        IDs that do not belong to the project are ignored.
+        """
+        if not task_ids:
+            return []
+        if status == TaskStatus.DONE:
+            closed_at = case((Task.closed_at.is_(None), datetime.utcnow()), else_=Task.closed_at)
+        else:
+            closed_at = None
+        stmt = (
+            update(Task)
+            .where(Task.project_id == project.id, Task.id.in_(task_ids))
+            .values(status=status, closed_at=closed_at)
+            .returning(Task)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.scalars(stmt)
+        tasks = list(result.all())
+        await self.db.commit()
+        return tasks
+
+    async def version_by_project(self, project: Project) -> Tuple[Optional[datetime], int]:
+        """Asynchronously gets a cheap change signal for a project's tasks: (max(updated_at), count(*))."""
+        stmt = select(func.max(Task.updated_at), func.count()).where(Task.project_id == project.id)
+        result = await self.db.execute(stmt)
+        last_modified, count = result.one()
+        return last_modified, count
+
+    async def count_by_project(self, project: Project) -> int:
+        """Asynchronously counts the tasks of a project without loading them."""
+        stmt = select(func.count()).select_from(Task).where(Task.project_id == project.id)
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
 
     async def get_overdue_tasks(self) -> List[Task]:
         """Asynchronously gets all tasks that are past their deadline and not done."""
         now = datetime.utcnow()
-        stmt = select(Task).where(Task.deadline < now, Task.status != TaskStatus.DONE)
+        stmt = select(Task).where(Task.deadline < now, OPEN_TASK)
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
+
+    async def next_open_deadline(self) -> Optional[datetime]:
+        """Asynchronously gets the earliest deadline among tasks that are not done (an index lookup)."""
+        stmt = select(func.min(Task.deadline)).where(OPEN_TASK)
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
+
+    async def close_overdue_tasks(self, batch_size: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Asynchronously marks every overdue, not-done task as DONE with set-based UPDATEs.
+        With `batch_size` the backlog is closed in chunks of at most that many rows,
+        each committed on its own so row locks are held only briefly.
+        Returns the (task ID, project ID) pairs of the closed tasks.
+        """
+        now = datetime.utcnow()
+        overdue = (Task.deadline < now, OPEN_TASK)
+        closed: List[Tuple[int, int]] = []
+        while True:
+            stmt = update(Task).values(status=TaskStatus.DONE, closed_at=now)
+            if batch_size is None:
+                stmt = stmt.where(*overdue)
+            else:
+                # SKIP LOCKED lets several workers split a large backlog without blocking each other
+                batch = (
+                    select(Task.id).where(*overdue).limit(batch_size)
+                    .with_for_update(skip_locked=True).scalar_subquery()
+                )
+                stmt = stmt.where(Task.id.in_(batch))
+            result = await self.db.execute(
+                stmt.returning(Task.id, Task.project_id).execution_options(synchronize_session=False)
+            )
+            rows = [(task_id, project_id) for task_id, project_id in result.all()]
+            await self.db.commit()
+            closed.extend(rows)
+            if batch_size is None or len(rows) < batch_size:
+                return closed
+
+    async def stream_rows(self, project_id: Optional[int] = None,
+                          partition_size: int = 1000) -> AsyncIterator[Sequence[Row]]:
+        """
+        Asynchronously streams plain task rows (no ORM instances) through a server-side cursor,
+        `partition_size` rows at a time, optionally limited to one project.
+        """
+        stmt = select(
+            Task.id, Task.project_id, Task.title, Task.description, Task.status,
+            Task.deadline, Task.created_at, Task.closed_at
+        ).order_by(Task.id)
+        if project_id is not None:
+            stmt = stmt.where(Task.project_id == project_id)
+        result = await self.db.stream(stmt.execution_options(yield_per=partition_size))
+        async for partition in result.partitions():
+            yield partition
@@ -1,5 +1,8 @@
 from .base_service import BaseService
 from .project_service import ProjectService
 from .task_service import TaskService
+from .export_service import ExportService
+from .change_service import ChangeService
+from .project_stats_service import ProjectStatsService
 
-__all__ = ["BaseService", "ProjectService", "TaskService"]
\ No newline at end of file
+__all__ = ["BaseService", "ProjectService", "TaskService", "ExportService", "ChangeService", "ProjectStatsService"]
\ No newline at end of file
@@ -1,14 +1,37 @@
-from typing import Optional
+from typing import Any, Iterable, Optional
 from app.exceptions.base import ValidationError
+from app.repositories import ProjectStatsRepository
 
 
 class BaseService:
     """Base service class with shared validation logic."""
 
+    # Set by services whose writes must keep the project_stats counters current
+    stats: Optional[ProjectStatsRepository] = None
+
+    async def _refresh_stats(self, project_ids: Iterable[int]) -> None:
+        """Recount the task counters of the given projects if the service maintains them."""
+        if self.stats is not None:
+            await self.stats.refresh(project_ids)
+
+    def _record_text(self, record: Any, field: str) -> Optional[str]:
+        """
+        Read a text field of an imported record (None when absent or empty).
+        Records that are not objects and non-text values are rejected with a ValidationError.
+        """
+        if not isinstance(record, dict):
+            raise ValidationError("Malformed record")
+        value = record.get(field)
+        if value is None or value == "":
+            return None
+        if not isinstance(value, str):
+            raise ValidationError(f"Field '{field}' must be text")
+        return value
+
     def _validate_text(self, text: Optional[str], max_words: int, field: str) -> None:
         """Validate text length to prevent overly long inputs."""
         if text is None:
             return
         words = text.split()
         if len(words) > max_words:
-            raise ValidationError(f"{field} exceeds {max_words} words")
\ No newline at end of file
+            raise ValidationError(f"{field} exceeds {max_words} words")
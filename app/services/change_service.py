@@ -0,0 +1,49 @@
+from typing import Any, Dict, List, Tuple
+from app.repositories.change_repository import SQLAlchemyChangeRepository
+from app.exceptions.base import ValidationError
+from .base_service import BaseService
+
+
+def parse_cursor(since: str) -> Tuple[int, int]:
+    """Decode a `next_since` cursor ("<txid>:<revision>"); "0" starts a full sync."""
+    if since == "0":
+        return (0, 0)
+    txid, sep, revision = since.partition(":")
+    if not sep or not txid.isdigit() or not revision.isdigit():
+        raise ValidationError("'since' must be 0 or a next_since value returned by this endpoint")
+    return (int(txid), int(revision))
+
+
+def format_cursor(row: Any) -> str:
+    return f"{row.txid}:{row.revision}"
+
+
+class ChangeService(BaseService):
+    def __init__(self, change_repo: SQLAlchemyChangeRepository) -> None:
+        self.change_repo = change_repo
+
+    async def changes_since(self, since: str, limit: int) -> Dict[str, Any]:
+        """
+        Collect up to `limit` changes (projects, tasks and deletions) after the `since` cursor.
+        Changes are ordered by (writing transaction id, revision) and capped below the oldest
+        transaction still in flight: a revision drawn by a transaction that commits later than
+        one with a higher revision would otherwise land behind a client's cursor and be skipped.
+        A long-running write transaction therefore delays the feed until it finishes.
+        """
+        position = parse_cursor(since)
+        high_water = await self.change_repo.high_water()
+        # One row past the page from each source tells whether more changes are pending
+        projects = await self.change_repo.projects_since(position, high_water, limit + 1)
+        tasks = await self.change_repo.tasks_since(position, high_water, limit + 1)
+        tombstones = await self.change_repo.tombstones_since(position, high_water, limit + 1)
+
+        changes: List[Any] = sorted(projects + tasks + tombstones, key=lambda row: (row.txid, row.revision))
+        page = changes[:limit]
+        included = {id(row) for row in page}
+        return {
+            "projects": [p for p in projects if id(p) in included],
+            "tasks": [t for t in tasks if id(t) in included],
+            "deleted": [t for t in tombstones if id(t) in included],
+            "next_since": format_cursor(page[-1]) if page else since,
+            "has_more": len(changes) > limit,
+        }
@@ -0,0 +1,64 @@
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Optional, Sequence
+from sqlalchemy.engine import Row
+from app.repositories.project_repository import SQLAlchemyProjectRepository
+from app.repositories.task_repository import SQLAlchemyTaskRepository
+from app.exceptions.base import ValidationError
+from .base_service import BaseService
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+
+def _plain(value: Any) -> Any:
+    """Convert a column value into something JSON/CSV can hold."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class ExportService(BaseService):
+    """Streams projects and tasks out as NDJSON or CSV without materializing them."""
+
+    def __init__(self, project_repo: SQLAlchemyProjectRepository, task_repo: SQLAlchemyTaskRepository) -> None:
+        self.project_repo = project_repo
+        self.task_repo = task_repo
+
+    async def export_projects(self, fmt: str) -> AsyncIterator[str]:
+        """Return a stream of text chunks holding every project in the given format."""
+        self._validate_format(fmt)
+        return self._encode(self.project_repo.stream_rows(), fmt)
+
+    async def export_tasks(self, fmt: str, project_id: Optional[int] = None) -> AsyncIterator[str]:
+        """Return a stream of text chunks holding every task, or the tasks of one project."""
+        self._validate_format(fmt)
+        if project_id is not None:
+            await self.project_repo.get(project_id)  # Fail before streaming starts
+        return self._encode(self.task_repo.stream_rows(project_id), fmt)
+
+    def _validate_format(self, fmt: str) -> None:
+        if fmt not in EXPORT_FORMATS:
+            raise ValidationError(f"Invalid export format '{fmt}' (use {' or '.join(EXPORT_FORMATS)})")
+
+    async def _encode(self, partitions: AsyncIterator[Sequence[Row]], fmt: str) -> AsyncIterator[str]:
+        """Encode each partition of rows into one text chunk."""
+        header_written = False
+        async for partition in partitions:
+            if fmt == "ndjson":
+                yield "".join(
+                    json.dumps({key: _plain(value) for key, value in row._mapping.items()}) + "\n"
+                    for row in partition
+                )
+                continue
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            if not header_written and partition:
+                writer.writerow(partition[0]._fields)
+                header_written = True
+            writer.writerows([_plain(value) for value in row] for row in partition)
+            yield buffer.getvalue()
@@ -1,11 +1,14 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict, Any
+from datetime import datetime
+from sqlalchemy.engine import Row
 from app.models.project import Project
 from app.core.config import Config
-from app.repositories.project_repository import SQLAlchemyProjectRepository
+from app.repositories.project_repository import SQLAlchemyProjectRepository, PROJECT_FIELDS
 from app.exceptions.service_exceptions import (
     ProjectLimitExceededError,
     DuplicateProjectNameError,
 )
+from app.exceptions.base import TodoListError, ValidationError
 from .base_service import BaseService
 
 class ProjectService(BaseService):
@@ -39,9 +42,63 @@ class ProjectService(BaseService):
     async def delete_project(self, project_id: int) -> None:
         await self.project_repo.delete(project_id)
 
-    async def list_projects(self) -> List[Project]:
-        return await self.project_repo.list_all()
+    async def list_projects(self, limit: Optional[int] = None,
+                            after: Optional[Tuple[datetime, int]] = None) -> List[Row]:
+        return await self.project_repo.list_all(limit, after)
 
-    async def get_project_with_tasks(self, project_id: int) -> Project:
-        return await self.project_repo.get_with_tasks(project_id)
+    async def listing_version(self) -> Tuple[Optional[datetime], int]:
+        """(last modification time, row count) of the project table, for conditional GETs."""
+        return await self.project_repo.version()
 
+    async def get_project(self, project_id: int, fields: Optional[List[str]] = None,
+                          include_tasks: bool = False) -> Dict[str, Any]:
+        """
+        Get a project restricted to the requested `fields` (all when None; the ID is always included),
+        with its tasks only when `include_tasks` is set.
+        """
+        if fields:
+            unknown = set(fields) - set(PROJECT_FIELDS)
+            if unknown:
+                raise ValidationError(f"Unknown project field(s): {', '.join(sorted(unknown))}")
+            columns = [field for field in PROJECT_FIELDS if field == "id" or field in fields]
+        else:
+            columns = list(PROJECT_FIELDS)
+        project = await self.project_repo.get_fields(project_id, columns)
+        if include_tasks:
+            project["tasks"] = await self.project_repo.task_rows(project_id)
+        return project
+
+    async def import_projects(self, chunk: List[Tuple[int, Any]]) -> Tuple[int, List[Tuple[int, TodoListError]]]:
+        """
+        Validate and bulk-load one chunk of (line number, row) project records.
+        Invalid or malformed rows and names that already exist are skipped and returned as (line, error) pairs.
+        The project limit is not enforced: this is the bulk migration path.
+        """
+        records = []
+        errors: List[Tuple[int, TodoListError]] = []
+        valid: List[Tuple[int, str, Optional[str]]] = []
+        for line, row in chunk:
+            try:
+                name = self._record_text(row, "name")
+                description = self._record_text(row, "description")
+                if not name:
+                    raise ValidationError("Project name is required")
+                self._validate_text(name, 30, "Project name")
+                self._validate_text(description, 150, "Project description")
+            except TodoListError as e:
+                errors.append((line, e))
+                continue
+            valid.append((line, name, description))
+
+        seen = set()
+        existing = await self.project_repo.ids_by_name(name for _, name, _ in valid)
+        now = datetime.utcnow()
+        for line, name, description in valid:
+            if name in existing or name in seen:
+                errors.append((line, DuplicateProjectNameError(f"Project name '{name}' already exists")))
+                continue
+            seen.add(name)
+            records.append((name, description, now, now))
+        if records:
+            await self.project_repo.copy_rows(records)
+        return len(records), sorted(errors, key=lambda error: error[0])
@@ -0,0 +1,20 @@
+from typing import List
+from sqlalchemy.engine import Row
+from app.core.config import Config
+from app.repositories.project_stats_repository import SQLAlchemyProjectStatsRepository
+from .base_service import BaseService
+
+
+class ProjectStatsService(BaseService):
+    def __init__(self, stats_repo: SQLAlchemyProjectStatsRepository, config: Config) -> None:
+        self.stats_repo = stats_repo
+        self.config = config
+
+    async def project_stats(self) -> List[Row]:
+        """
+        Task counts by status, plus overdue tasks, for every project.
+        Read from the project_stats counters when they are maintained, otherwise aggregated live.
+        """
+        if self.config.project_stats_table:
+            return await self.stats_repo.stored()
+        return await self.stats_repo.aggregate()
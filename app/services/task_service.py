@@ -1,5 +1,6 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict, Any
 from datetime import datetime
+from sqlalchemy.engine import Row
 from app.models.project import Project
 from app.models.task import Task, TaskStatus
 from app.core.config import Config
@@ -10,14 +11,18 @@ from app.exceptions.service_exceptions import (
     InvalidStatusError,
     InvalidDeadlineError,
 )
-from app.exceptions.base import ValidationError
+from app.exceptions.base import ValidationError, TodoListError
+from app.exceptions.repository_exceptions import ProjectNotFoundError
+from app.repositories import ProjectStatsRepository
 from .base_service import BaseService
 
 class TaskService(BaseService):
-    def __init__(self, project_repo: SQLAlchemyProjectRepository, task_repo: SQLAlchemyTaskRepository, config: Config) -> None:
+    def __init__(self, project_repo: SQLAlchemyProjectRepository, task_repo: SQLAlchemyTaskRepository, config: Config,
+                 stats: Optional[ProjectStatsRepository] = None) -> None:
         self.project_repo = project_repo
         self.task_repo = task_repo
         self.config = config
+        self.stats = stats
 
     def _parse_deadline(self, deadline_str: Optional[str]) -> Optional[datetime]:
         """(No change needed) This is a synchronous, pure-logic function."""
@@ -32,20 +37,59 @@ class TaskService(BaseService):
     async def create_task(self, project_id: int, title: str, description: Optional[str] = None,
                           status: str = "todo", deadline_str: Optional[str] = None) -> Task:
         """Asynchronously create a new task."""
+        status_enum, deadline = self._validate_new_task(title, description, status, deadline_str)
+        project = await self.project_repo.get(project_id)
+        task = await self.task_repo.create_if_below_limit(
+            project, self.config.max_tasks, title, description, status_enum, deadline
+        )
+        if task is None:
+            raise TaskLimitExceededError("Maximum tasks per project exceeded")
+        await self._refresh_stats([project_id])
+        return task
+
+    async def create_tasks(self, project_id: int,
+                           items: List[Dict[str, Any]]) -> Tuple[List[Task], List[Tuple[int, TodoListError]]]:
+        """
+        Asynchronously create several tasks in one transaction.
+        Each item takes the keyword arguments of `create_task` (title, description, status, deadline_str).
+        Invalid items are skipped and reported as (index, error) pairs; the valid ones
+        are inserted together, provided they all fit within the project's task limit.
+        """
+        rows: List[Dict[str, Any]] = []
+        errors: List[Tuple[int, TodoListError]] = []
+        for index, item in enumerate(items):
+            try:
+                status_enum, deadline = self._validate_new_task(
+                    item["title"], item.get("description"), item.get("status", "todo"), item.get("deadline_str")
+                )
+            except TodoListError as e:
+                errors.append((index, e))
+                continue
+            rows.append({
+                "title": item["title"],
+                "description": item.get("description"),
+                "status": status_enum,
+                "deadline": deadline,
+            })
+
+        project = await self.project_repo.get(project_id)
+        tasks = await self.task_repo.create_many_if_below_limit(project, self.config.max_tasks, rows)
+        if tasks is None:
+            raise TaskLimitExceededError("Maximum tasks per project exceeded")
+        if tasks:
+            await self._refresh_stats([project_id])
+        return tasks, errors
+
+    def _validate_new_task(self, title: str, description: Optional[str], status: str,
+                           deadline_str: Optional[str]) -> Tuple[TaskStatus, Optional[datetime]]:
+        """Validate the fields of a task to be created, returning its parsed status and deadline."""
         self._validate_text(title, 30, "Task title")
         self._validate_text(description, 150, "Task description")
         try:
             status_enum = TaskStatus(status.lower())
         except ValueError:
             raise InvalidStatusError(f"Invalid status '{status}'")
-
-        project = await self.project_repo.get(project_id)
-        tasks = await self.task_repo.list_by_project(project)
-        if len(tasks) >= self.config.max_tasks:
-            raise TaskLimitExceededError("Maximum tasks per project exceeded")
-
-        deadline = self._parse_deadline(deadline_str)
-        return await self.task_repo.create(project, title, description, status_enum, deadline)
+        return status_enum, self._parse_deadline(deadline_str)
 
     async def change_task_status(self, project_id: int, task_id: int, new_status: str) -> Task:
         """Asynchronously change a task's status."""
@@ -54,9 +98,8 @@ class TaskService(BaseService):
         except ValueError:
             raise InvalidStatusError(f"Invalid status '{new_status}'")
 
-        project = await self.project_repo.get(project_id)
-        task = await self.task_repo.get(task_id)
-        if task.project_id != project.id:
+        task = await self.task_repo.get_in_project(project_id, task_id)
+        if task.project_id != project_id:
             raise ValidationError("Task does not belong to the specified project")
 
         task.status = status_enum
@@ -65,15 +108,29 @@ class TaskService(BaseService):
         elif status_enum != TaskStatus.DONE:
             task.closed_at = None # Re-open the task if status is changed from done
 
-        return await self.task_repo.update(task)
+        task = await self.task_repo.update(task)
+        await self._refresh_stats([project_id])
+        return task
+
+    async def change_tasks_status(self, project_id: int, task_ids: List[int], new_status: str) -> List[Task]:
+        """Asynchronously change the status of several tasks of a project at once."""
+        try:
+            status_enum = TaskStatus(new_status.lower())
+        except ValueError:
+            raise InvalidStatusError(f"Invalid status '{new_status}'")
+
+        project = await self.project_repo.get(project_id)
+        tasks = await self.task_repo.set_status_many(project, task_ids, status_enum)
+        if tasks:
+            await self._refresh_stats([project_id])
+        return tasks
 
     async def edit_task(self, project_id: int, task_id: int, new_title: Optional[str] = None,
                         new_description: Optional[str] = None, new_status: Optional[str] = None,
                         new_deadline_str: Optional[str] = None) -> Task:
         """Asynchronously edit task details."""
-        project = await self.project_repo.get(project_id)
-        task = await self.task_repo.get(task_id)
-        if task.project_id != project.id:
+        task = await self.task_repo.get_in_project(project_id, task_id)
+        if task.project_id != project_id:
             raise ValidationError("Task does not belong to the specified project")
 
         if new_title is not None:
@@ -95,17 +152,89 @@ class TaskService(BaseService):
         if new_deadline_str is not None:
             task.deadline = self._parse_deadline(new_deadline_str)
 
-        return await self.task_repo.update(task)
+        task = await self.task_repo.update(task)
+        if new_status is not None:
+            await self._refresh_stats([project_id])
+        return task
 
     async def delete_task(self, project_id: int, task_id: int) -> None:
         """Asynchronously delete a task."""
-        project = await self.project_repo.get(project_id)
-        task = await self.task_repo.get(task_id) # Ensure task exists before checking ownership
-        if task.project_id != project.id:
+        task = await self.task_repo.get_in_project(project_id, task_id) # Ensure task exists before checking ownership
+        if task.project_id != project_id:
             raise ValidationError("Task does not belong to the specified project")
         await self.task_repo.delete(task_id)
+        await self._refresh_stats([project_id])
 
-    async def list_tasks(self, project_id: int) -> List[Task]:
-        """Asynchronously list tasks for a project."""
+    async def tasks_version(self, project_id: int) -> Tuple[Optional[datetime], int]:
+        """Asynchronously get (last modification time, task count) of a project's tasks, for conditional GETs."""
         project = await self.project_repo.get(project_id)
-        return await self.task_repo.list_by_project(project)
+        return await self.task_repo.version_by_project(project)
+
+    async def list_tasks(self, project_id: int, limit: Optional[int] = None,
+                         after: Optional[Tuple[Optional[datetime], int]] = None,
+                         statuses: Optional[List[str]] = None,
+                         deadline_from_str: Optional[str] = None, deadline_to_str: Optional[str] = None,
+                         closed: Optional[bool] = None, sort: str = "created_at") -> List[Row]:
+        """Asynchronously list tasks for a project, optionally filtered, sorted and one keyset page at a time."""
+        status_enums = None
+        if statuses:
+            try:
+                status_enums = [TaskStatus(status.lower()) for status in statuses]
+            except ValueError:
+                raise InvalidStatusError(f"Invalid status in {statuses}")
+        project = await self.project_repo.get(project_id)
+        return await self.task_repo.list_by_project(
+            project, limit, after,
+            statuses=status_enums,
+            deadline_from=self._parse_deadline(deadline_from_str),
+            deadline_to=self._parse_deadline(deadline_to_str),
+            closed=closed,
+            sort=sort,
+        )
+
+    async def search_tasks(self, query: str, project_id: Optional[int] = None,
+                           limit: int = 20, offset: int = 0) -> List[Tuple[Task, float]]:
+        """Asynchronously search tasks across all projects (or one) by keyword, best matches first."""
+        if not query.strip():
+            raise ValidationError("Search query must not be empty")
+        if project_id is not None:
+            await self.project_repo.get(project_id)
+        return await self.task_repo.search(query, project_id, limit, offset)
+
+    async def import_tasks(self, chunk: List[Tuple[int, Any]]) -> Tuple[int, List[Tuple[int, TodoListError]]]:
+        """
+        Validate and bulk-load one chunk of (line number, row) task records.
+        Rows name their project by `project`; invalid or malformed rows and unknown projects are
+        skipped and returned as (line, error) pairs.
+        The per-project task limit is not enforced: this is the bulk migration path.
+        """
+        records = []
+        errors: List[Tuple[int, TodoListError]] = []
+        valid = []
+        for line, row in chunk:
+            try:
+                title = self._record_text(row, "title")
+                description = self._record_text(row, "description")
+                project = self._record_text(row, "project")
+                if not title:
+                    raise ValidationError("Task title is required")
+                status_enum, deadline = self._validate_new_task(
+                    title, description, self._record_text(row, "status") or "todo", self._record_text(row, "deadline")
+                )
+            except TodoListError as e:
+                errors.append((line, e))
+                continue
+            valid.append((line, title, description, status_enum, deadline, project))
+
+        project_ids = await self.project_repo.ids_by_name(project or "" for *_, project in valid)
+        now = datetime.utcnow()
+        for line, title, description, status_enum, deadline, project in valid:
+            project_id = project_ids.get(project or "")
+            if project_id is None:
+                errors.append((line, ProjectNotFoundError(f"Project '{project}' not found")))
+                continue
+            records.append((title, description, status_enum.name, deadline, now, None, now, project_id))
+        if records:
+            await self.task_repo.copy_rows(records)
+            await self._refresh_stats({record[-1] for record in records})
+        return len(records), sorted(errors, key=lambda error: error[0])
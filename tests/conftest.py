@@ -0,0 +1,86 @@
+"""
+Shared fixtures.
+
+Database tests run against a disposable PostgreSQL database named by TEST_DB_NAME, reached
+with the usual DB_USER / DB_PASSWORD / DB_HOST / DB_PORT settings. Its public schema is dropped
+and rebuilt from the Alembic migrations once per run, and every table is truncated before
+each test. Without TEST_DB_NAME those tests are skipped.
+"""
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Tuple
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+TEST_DB_NAME = os.getenv("TEST_DB_NAME")
+
+if TEST_DB_NAME:
+    # Must happen before app.db.session builds its engines from the environment
+    os.environ["DB_NAME"] = TEST_DB_NAME
+
+TABLES = "project_stats, tombstones, tasks, projects"
+
+
+@pytest.fixture(scope="session")
+def loop():
+    """One event loop for the whole run, so the app's pooled asyncpg connections stay usable."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def run(loop) -> Callable[[Awaitable[Any]], Any]:
+    """Run a coroutine to completion on the shared loop."""
+    return loop.run_until_complete
+
+
+@pytest.fixture(scope="session")
+def database(run):
+    """Rebuild the test database schema from the migrations."""
+    if not TEST_DB_NAME:
+        pytest.skip("TEST_DB_NAME is not set")
+    from alembic import command
+    from alembic.config import Config as AlembicConfig
+    from sqlalchemy import text
+    from app.db.session import async_engine, get_sync_engine
+
+    with get_sync_engine().begin() as connection:
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+    alembic_config = AlembicConfig(str(ROOT / "alembic.ini"))
+    alembic_config.set_main_option("script_location", str(ROOT / "alembic"))
+    command.upgrade(alembic_config, "head")
+    yield
+    run(async_engine.dispose())
+
+
+@pytest.fixture
+def db(database, run):
+    """A fresh AsyncSession on empty tables."""
+    from sqlalchemy import text
+    from app.db.session import AsyncSessionLocal, get_sync_engine
+
+    with get_sync_engine().begin() as connection:
+        connection.execute(text(f"TRUNCATE {TABLES} RESTART IDENTITY CASCADE"))
+    session = AsyncSessionLocal()
+    yield session
+    run(session.close())
+
+
+@pytest.fixture
+def statements(database) -> List[Tuple[str, Any]]:
+    """(SQL, parameters) of every statement the async engine sends while the test runs."""
+    from sqlalchemy import event
+    from app.db.session import async_engine
+
+    captured: List[Tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield captured
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
@@ -0,0 +1,65 @@
+"""Change feed ordering under concurrent writers."""
+
+
+def _sync(run, service, since="0"):
+    pages = []
+    while True:
+        page = run(service.changes_since(since, 10))
+        pages.append(page)
+        since = page["next_since"]
+        if not page["has_more"]:
+            return pages, since
+
+
+def test_feed_waits_for_transactions_still_in_flight(run, db):
+    from app.db.session import AsyncSessionLocal
+    from app.models.project import Project
+    from app.repositories.change_repository import SQLAlchemyChangeRepository
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.services.change_service import ChangeService
+
+    service = ChangeService(SQLAlchemyChangeRepository(db))
+    slow = AsyncSessionLocal()
+    fast = AsyncSessionLocal()
+    try:
+        # Draws the lower revision, but commits after "fast"
+        slow_project = Project(name="slow")
+        slow.add(slow_project)
+        run(slow.flush())
+        fast_project = run(SQLAlchemyProjectRepository(fast).create("fast"))
+        assert slow_project.revision < fast_project.revision
+
+        pages, since = _sync(run, service)
+        assert [p.name for page in pages for p in page["projects"]] == []
+
+        run(slow.commit())
+    finally:
+        run(slow.close())
+        run(fast.close())
+
+    pages, since = _sync(run, service, since)
+    assert sorted(p.name for page in pages for p in page["projects"]) == ["fast", "slow"]
+    assert run(service.changes_since(since, 10))["projects"] == []
+
+
+def test_has_more_when_one_source_fills_the_page(run, db):
+    from app.repositories.change_repository import SQLAlchemyChangeRepository
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+    from app.services.change_service import ChangeService
+
+    project = run(SQLAlchemyProjectRepository(db).create("p"))
+    service = ChangeService(SQLAlchemyChangeRepository(db))
+    since = run(service.changes_since("0", 10))["next_since"]
+    # Only task changes are pending, more than one page of them
+    run(SQLAlchemyTaskRepository(db).create_many_if_below_limit(
+        project, 100, [{"title": f"t{n}"} for n in range(15)]
+    ))
+
+    page = run(service.changes_since(since, 10))
+    assert len(page["tasks"]) == 10 and not page["projects"] and not page["deleted"]
+    assert page["has_more"]
+
+    page = run(service.changes_since(page["next_since"], 10))
+    assert len(page["tasks"]) == 5
+    assert not page["has_more"]
@@ -0,0 +1,21 @@
+from starlette.requests import Request
+
+from app.api.conditional import is_not_modified, make_etag
+
+
+def _request(if_none_match=None):
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_is_not_modified_uses_weak_comparison():
+    etag = make_etag("projects", 3)
+    opaque = etag[2:]
+
+    assert is_not_modified(_request(etag), etag)
+    # Proxies may strip the weak indicator; the tag still names the same representation
+    assert is_not_modified(_request(opaque), etag)
+    assert is_not_modified(_request(f'"other", {opaque}'), etag)
+    assert is_not_modified(_request("*"), etag)
+    assert not is_not_modified(_request(), etag)
+    assert not is_not_modified(_request(make_etag("projects", 4)), etag)
@@ -0,0 +1,40 @@
+"""
+Process-wide settings (user-007): get_config() reads the environment and .env once, and the
+cached instance is read-only. The micro-benchmark prints the per-request cost of resolving the
+settings dependency against building a Config per request, as the controllers used to.
+"""
+import timeit
+
+import pytest
+
+
+def test_get_config_loads_dotenv_once(monkeypatch):
+    from app.core import config as config_module
+
+    calls = []
+    monkeypatch.setattr(config_module, "load_dotenv", lambda: calls.append(1))
+    config_module.get_config.cache_clear()
+    try:
+        first = config_module.get_config()
+        assert all(config_module.get_config() is first for _ in range(100))
+        assert len(calls) == 1
+    finally:
+        config_module.get_config.cache_clear()
+
+
+def test_config_is_read_only():
+    from app.core.config import get_config
+
+    with pytest.raises(AttributeError):
+        get_config().max_tasks = 1
+
+
+def test_cached_config_dependency_overhead():
+    from app.core.config import Config, get_config
+
+    get_config()
+    calls = 2000
+    cached = timeit.timeit(get_config, number=calls) / calls
+    per_request = timeit.timeit(Config, number=calls) / calls
+    print(f"\nsettings per request: get_config() {cached * 1e6:.2f} us, Config() {per_request * 1e6:.2f} us")
+    assert cached * 10 < per_request
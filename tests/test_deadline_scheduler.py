@@ -0,0 +1,64 @@
+"""DeadlineScheduler keeps running through failures and does not spin on locked rows."""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+
+class _Stop(BaseException):
+    pass
+
+
+def _scheduler(monkeypatch, deadlines, closed_counts, sleeps):
+    from app.commands import deadline_scheduler as module
+
+    deadlines = iter(deadlines)
+    closed_counts = iter(closed_counts)
+
+    async def next_deadline(self):
+        value = next(deadlines)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    async def autoclose(batch_size=None):
+        return next(closed_counts)
+
+    async def watch(self):
+        await asyncio.Event().wait()
+
+    async def sleep(delay):
+        sleeps.append(delay)
+        if len(sleeps) >= 5:
+            raise _Stop
+
+    async def wait_for(awaitable, timeout):
+        awaitable.close()
+        await sleep(timeout)
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(module.DeadlineScheduler, "_next_deadline", next_deadline)
+    monkeypatch.setattr(module.DeadlineScheduler, "_watch_task_events", watch)
+    monkeypatch.setattr(module, "autoclose_overdue_tasks", autoclose)
+    monkeypatch.setattr(module.asyncio, "sleep", sleep)
+    monkeypatch.setattr(module.asyncio, "wait_for", wait_for)
+    return module.DeadlineScheduler(max_sleep=3)
+
+
+def test_failures_back_off_up_to_max_sleep(monkeypatch):
+    sleeps = []
+    scheduler = _scheduler(monkeypatch, [OSError("down")] * 4 + [None], [], sleeps)
+    with pytest.raises(_Stop):
+        asyncio.run(scheduler.run())
+    # Doubling back-off capped at max_sleep, then the normal idle sleep once the lookup succeeds
+    assert sleeps == [1, 2, 3, 3, 3]
+
+
+def test_overdue_rows_it_cannot_close_back_off(monkeypatch):
+    sleeps = []
+    overdue = datetime.utcnow() - timedelta(minutes=1)
+    scheduler = _scheduler(monkeypatch, [overdue] * 6, [0, 0, 2, 0, 0, 0], sleeps)
+    with pytest.raises(_Stop):
+        asyncio.run(scheduler.run())
+    # A successful close resets the back-off
+    assert sleeps == [1, 2, 1, 2, 3]
@@ -0,0 +1,29 @@
+"""SSE subscriptions live exactly as long as the streamed body."""
+import asyncio
+
+
+def test_stream_subscribes_only_while_the_body_is_iterated(run, database, monkeypatch):
+    from app.api.controllers import events_controller
+    from app.db.session import ASYNCPG_DSN
+    from app.realtime.broker import EventBroker
+
+    broker = EventBroker(ASYNCPG_DSN, 10)
+    monkeypatch.setattr(events_controller, "get_event_broker", lambda: broker)
+
+    async def stream_then_disconnect():
+        # A response that is never iterated (client gone before the body starts) leaves nothing behind
+        response = await events_controller.stream_events(project_id=None)
+        assert not broker.subscribers
+
+        waiting = asyncio.create_task(response.body_iterator.__anext__())
+        await asyncio.sleep(0.2)
+        assert len(broker.subscribers) == 1
+        # Client disconnects while the stream waits for an event
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        assert not broker.subscribers
+
+    try:
+        run(stream_then_disconnect())
+    finally:
+        run(broker.close())
@@ -0,0 +1,73 @@
+"""Change events: emitted by the writing transaction, and survived by the broker across reconnects."""
+import asyncio
+
+
+async def _listen(dsn, channel):
+    import asyncpg
+
+    received: "asyncio.Queue[str]" = asyncio.Queue()
+    connection = await asyncpg.connect(dsn)
+    await connection.add_listener(channel, lambda conn, pid, chan, payload: received.put_nowait(payload))
+    return connection, received
+
+
+def test_writes_notify_on_commit_only(run, db, statements):
+    import json
+    from app.db.session import ASYNCPG_DSN
+    from app.models.project import Project
+    from app.realtime.events import EVENTS_CHANNEL
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+    connection, received = run(_listen(ASYNCPG_DSN, EVENTS_CHANNEL))
+    try:
+        project = run(SQLAlchemyProjectRepository(db).create("p"))
+        statements.clear()
+        task = run(SQLAlchemyTaskRepository(db).create(project, "t"))
+        # The INSERT itself queues the event; no extra statement or commit is needed
+        assert [sql.split()[0] for sql, _ in statements] == ["INSERT"]
+
+        events = [json.loads(run(asyncio.wait_for(received.get(), 5))) for _ in range(2)]
+        assert events == [
+            {"entity": "project", "action": "created", "project_id": project.id, "ids": [project.id]},
+            {"entity": "task", "action": "created", "project_id": project.id, "ids": [task.id]},
+        ]
+
+        db.add(Project(name="rolled back"))
+        run(db.flush())
+        run(db.rollback())
+        run(asyncio.sleep(0.2))
+        assert received.empty()
+    finally:
+        run(connection.close())
+
+
+def test_broker_drops_subscribers_when_its_connection_is_lost(run, db):
+    import asyncpg
+    from app.db.session import ASYNCPG_DSN
+    from app.realtime.broker import EventBroker
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+
+    broker = EventBroker(ASYNCPG_DSN, 10)
+    try:
+        subscriber = run(broker.subscribe())
+        pid = broker._connection.get_server_pid()
+
+        async def terminate():
+            admin = await asyncpg.connect(ASYNCPG_DSN)
+            try:
+                await admin.execute("SELECT pg_terminate_backend($1)", pid)
+            finally:
+                await admin.close()
+
+        run(terminate())
+        assert run(subscriber.next_event(timeout=5)) is None
+        assert subscriber.dropped and not broker.subscribers
+
+        # The next subscriber gets a fresh LISTEN connection and sees new changes
+        subscriber = run(broker.subscribe())
+        project = run(SQLAlchemyProjectRepository(db).create("p"))
+        event = run(subscriber.next_event(timeout=5))
+        assert event is not None and event["ids"] == [project.id]
+    finally:
+        run(broker.close())
@@ -0,0 +1,48 @@
+"""Bulk import (user-013): malformed lines and wrongly typed fields are rejected per row."""
+import json
+
+
+def test_read_rows_yields_unparseable_lines_as_none(database, tmp_path):
+    from app.commands.import_data import read_rows
+
+    path = tmp_path / "tasks.ndjson"
+    path.write_text('{"title": "a"}\n{not json\n\n[1, 2]\n')
+    assert list(read_rows(str(path), "ndjson")) == [(1, {"title": "a"}), (2, None), (4, [1, 2])]
+
+
+def test_import_tasks_rejects_bad_rows_and_loads_the_rest(run, db, tmp_path):
+    from app.commands.import_data import import_data
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+    project = run(SQLAlchemyProjectRepository(db).create("home"))
+    lines = [
+        {"title": "ok", "project": "home"},
+        "{broken",
+        {"title": 42, "project": "home"},
+        {"title": "bad status", "status": ["todo"], "project": "home"},
+        {"title": "bad deadline", "deadline": 20250101, "project": "home"},
+        {"title": "elsewhere", "project": "nowhere"},
+        {"title": "also ok", "project": "home", "status": "done"},
+    ]
+    path = tmp_path / "tasks.ndjson"
+    path.write_text("\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines) + "\n")
+
+    run(import_data("tasks", str(path), "ndjson", batch_size=3))
+    titles = sorted(task.title for task in run(SQLAlchemyTaskRepository(db).list_by_project(project)))
+    assert titles == ["also ok", "ok"]
+
+
+def test_import_projects_rejects_malformed_rows(run, db):
+    from app.core.config import get_config
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.services.project_service import ProjectService
+
+    service = ProjectService(SQLAlchemyProjectRepository(db), get_config())
+    loaded, errors = run(service.import_projects([
+        (1, {"name": "a"}), (2, None), (3, {"name": ["a"]}), (4, {"name": "a"}), (5, "b"),
+    ]))
+    assert loaded == 1
+    assert [(line, type(error).__name__) for line, error in errors] == [
+        (2, "ValidationError"), (3, "ValidationError"), (4, "DuplicateProjectNameError"), (5, "ValidationError"),
+    ]
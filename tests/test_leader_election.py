@@ -0,0 +1,73 @@
+"""LeaderElection steps down, instead of stopping, when the job fails."""
+import asyncio
+
+import pytest
+
+
+def test_job_failure_releases_leadership_and_campaigns_again(run, database):
+    from sqlalchemy.exc import DBAPIError
+    from app.commands.leader_election import LeaderElection
+    from app.db.session import ASYNCPG_DSN
+
+    lock_id = 8472
+    attempts = []
+
+    async def job():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise DBAPIError("UPDATE tasks ...", None, Exception("connection reset"))
+        # Leading again: the failed attempt's session (and lock) is gone
+        raise asyncio.CancelledError
+
+    election = LeaderElection(ASYNCPG_DSN, lock_id, lease_interval=0.05)
+    with pytest.raises(asyncio.CancelledError):
+        run(asyncio.wait_for(election.run(job), 5))
+    assert attempts == [0, 1]
+
+
+def test_lock_is_released_only_after_the_job_has_stopped(run, database):
+    import asyncpg
+    from app.commands.leader_election import LeaderElection
+    from app.db.session import ASYNCPG_DSN
+
+    lock_id = 8473
+    events = []
+    leading = asyncio.Event()
+
+    class FailingLease(LeaderElection):
+        async def _renew(self, connection):
+            raise asyncio.TimeoutError
+
+    async def job():
+        if events:
+            # Leading again after stepping down: end the test
+            raise asyncio.CancelledError
+        leading.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            # Still finishing its write after the lease was lost
+            await asyncio.sleep(0.2)
+            events.append("job stopped")
+            raise
+
+    async def watch_lock():
+        other = await asyncpg.connect(ASYNCPG_DSN)
+        try:
+            while not await other.fetchval("SELECT pg_try_advisory_lock($1)", lock_id):
+                await asyncio.sleep(0.01)
+            events.append("lock released")
+            await other.fetchval("SELECT pg_advisory_unlock($1)", lock_id)
+        finally:
+            await other.close()
+
+    async def scenario():
+        election = asyncio.create_task(FailingLease(ASYNCPG_DSN, lock_id, lease_interval=0.05).run(job))
+        await asyncio.wait_for(leading.wait(), 5)
+        watcher = asyncio.create_task(watch_lock())
+        await asyncio.wait_for(watcher, 5)
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(election, 5)
+
+    run(scenario())
+    assert events == ["job stopped", "lock released"]
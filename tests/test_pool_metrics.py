@@ -0,0 +1,32 @@
+"""Pool metrics (user-006): checkout wait time and timeouts are reported."""
+import pytest
+
+
+def test_checkout_wait_and_timeouts_are_counted(run, database):
+    from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.db.pool import TimedAsyncQueuePool, counters_for
+    from app.db.session import ASYNC_DATABASE_URL, get_pool_metrics
+
+    class TestPool(TimedAsyncQueuePool):
+        metrics_name = "test"
+
+    engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=TestPool, pool_size=1, max_overflow=0,
+                                 pool_timeout=0.2)
+
+    async def exhaust():
+        async with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+
+    try:
+        run(exhaust())
+    finally:
+        run(engine.dispose())
+
+    counters = counters_for("test")
+    assert counters["checkout_timeouts"] == 1
+    assert counters["checkout_wait_max_seconds"] >= 0.2
+    assert counters["checkout_wait_seconds"] >= counters["checkout_wait_max_seconds"]
+    assert {"checkout_wait_seconds", "checkout_wait_max_seconds", "checkout_timeouts"} <= set(get_pool_metrics()["async"])
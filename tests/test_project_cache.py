@@ -0,0 +1,56 @@
+"""Project cache (user-014): a cached project deleted by another process reads as not found on writes."""
+import pytest
+
+
+@pytest.fixture
+def stale_project(run, db):
+    """A project cached by one repository and then deleted through another session."""
+    from app.core.cache import LRUTTLCache
+    from app.db.session import AsyncSessionLocal
+    from app.repositories.cached_project_repository import CachedProjectRepository
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+
+    repo = CachedProjectRepository(db, LRUTTLCache(16, 60))
+    project_id = run(repo.create("p")).id
+    db.expunge_all()
+    run(repo.get(project_id))  # Warm the cache
+
+    async def delete_elsewhere():
+        async with AsyncSessionLocal() as other:
+            await SQLAlchemyProjectRepository(other).delete(project_id)
+    run(delete_elsewhere())
+    db.expunge_all()
+    return repo, project_id
+
+
+def test_edit_of_deleted_cached_project_is_not_found(run, db, stale_project):
+    from app.core.config import get_config
+    from app.exceptions.repository_exceptions import ProjectNotFoundError
+    from app.services.project_service import ProjectService
+
+    repo, project_id = stale_project
+    with pytest.raises(ProjectNotFoundError):
+        run(ProjectService(repo, get_config()).edit_project(project_id, new_description="x"))
+    assert run(repo.cache.get(project_id)) is None
+
+
+def test_task_create_in_deleted_cached_project_is_not_found(run, db, stale_project):
+    from app.core.config import get_config
+    from app.exceptions.repository_exceptions import ProjectNotFoundError
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+    from app.services.task_service import TaskService
+
+    repo, project_id = stale_project
+    service = TaskService(repo, SQLAlchemyTaskRepository(db), get_config())
+    with pytest.raises(ProjectNotFoundError):
+        run(service.create_task(project_id, "t"))
+    with pytest.raises(ProjectNotFoundError):
+        run(service.create_tasks(project_id, [{"title": "t"}]))
+
+
+def test_delete_of_deleted_cached_project_is_not_found(run, db, stale_project):
+    from app.exceptions.repository_exceptions import ProjectNotFoundError
+
+    repo, project_id = stale_project
+    with pytest.raises(ProjectNotFoundError):
+        run(repo.delete(project_id))
@@ -0,0 +1,56 @@
+"""
+Project counting (user-001): count() is a single SELECT count(*), and creating a project stays
+cheap as the projects table grows, instead of loading every row to len() them.
+Timings are printed (pytest -s) and only compared loosely, to stay robust on busy machines.
+"""
+from sqlalchemy import func, select, text
+
+from tests.timing import median_latency
+
+
+def test_count_is_one_aggregate_statement(run, db, statements):
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+
+    run(SQLAlchemyProjectRepository(db).create("only"))
+    statements.clear()
+    assert run(SQLAlchemyProjectRepository(db).count()) == 1
+    assert len(statements) == 1
+    assert "count(*)" in statements[0][0]
+
+
+def test_create_latency_stays_flat_as_projects_grow(run, db, monkeypatch):
+    from app.core.config import Config
+    from app.models.project import Project
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.services.project_service import ProjectService
+
+    monkeypatch.setenv("MAX_NUMBER_OF_PROJECT", "1000000")
+    service = ProjectService(SQLAlchemyProjectRepository(db), Config())
+    names = (f"bench {n}" for n in range(1000))
+
+    async def seed(first: int, last: int):
+        await db.execute(text(
+            "INSERT INTO projects (name, created_at, updated_at) "
+            "SELECT 'seed ' || n, now(), now() FROM generate_series(CAST(:first AS integer), CAST(:last AS integer)) AS n"
+        ), {"first": first, "last": last})
+        await db.commit()
+        await db.execute(text("ANALYZE projects"))
+        await db.commit()
+
+    async def load_all_and_len():
+        # The pre-user-001 count(): every row materialised as an ORM object
+        result = await db.execute(select(Project))
+        rows = len(result.scalars().all())
+        db.expunge_all()
+        return rows
+
+    run(seed(1, 10))
+    small = median_latency(run, lambda: service.create_project(next(names)))
+    run(seed(11, 100_000))
+    large = median_latency(run, lambda: service.create_project(next(names)))
+    loading = median_latency(run, load_all_and_len, repeat=3)
+    print(f"\ncreate_project: {small * 1000:.2f} ms at 10 rows, {large * 1000:.2f} ms at 100k rows; "
+          f"loading every row to count: {loading * 1000:.2f} ms")
+
+    assert run(db.scalar(select(func.count()).select_from(Project))) > 100_000
+    assert large < loading / 5
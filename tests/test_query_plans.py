@@ -0,0 +1,66 @@
+"""
+Query-plan regression checks: the task listing and the overdue sweep must keep using
+their indexes (migration ca0e2bafd69c) rather than scanning the tasks table.
+"""
+from typing import Any, List, Tuple
+
+from sqlalchemy import text
+
+
+def seed(run, db) -> None:
+    """50 projects x 400 tasks; almost every task is done, a handful of open ones are overdue."""
+    async def go():
+        await db.execute(text(
+            "INSERT INTO projects (name, created_at, updated_at) "
+            "SELECT 'project ' || n, now(), now() FROM generate_series(1, 50) AS n"
+        ))
+        await db.execute(text(
+            "INSERT INTO tasks (title, status, deadline, created_at, updated_at, project_id) "
+            "SELECT 'task ' || n, CASE WHEN n % 1000 = 0 THEN 'TODO' ELSE 'DONE' END::taskstatus, "
+            "now() - interval '1 day' + n * interval '1 second', "
+            "now() - n * interval '1 second', now(), 1 + n % 50 "
+            "FROM generate_series(1, 20000) AS n"
+        ))
+        await db.commit()
+        await db.execute(text("ANALYZE projects"))
+        await db.execute(text("ANALYZE tasks"))
+        await db.commit()
+    run(go())
+
+
+def explain(run, db, captured: List[Tuple[str, Any]]) -> str:
+    """EXPLAIN the last statement the repository sent, with its own parameters."""
+    statement, parameters = captured[-1]
+
+    async def go():
+        connection = await db.connection()
+        result = await connection.exec_driver_sql("EXPLAIN " + statement, parameters)
+        return "\n".join(row[0] for row in result.all())
+    return run(go())
+
+
+def test_list_by_project_uses_project_created_at_index(run, db, statements):
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+    seed(run, db)
+    project = run(SQLAlchemyProjectRepository(db).get(7))
+    statements.clear()
+    run(SQLAlchemyTaskRepository(db).list_by_project(project, limit=100))
+
+    plan = explain(run, db, statements)
+    assert "ix_tasks_project_id_created_at" in plan, plan
+    assert "Seq Scan on tasks" not in plan, plan
+
+
+def test_overdue_queries_use_open_deadline_partial_index(run, db, statements):
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+    seed(run, db)
+    repo = SQLAlchemyTaskRepository(db)
+    for query in (repo.get_overdue_tasks(), repo.next_open_deadline()):
+        statements.clear()
+        run(query)
+        plan = explain(run, db, statements)
+        assert "ix_tasks_open_deadline" in plan, plan
+        assert "Seq Scan on tasks" not in plan, plan
@@ -0,0 +1,67 @@
+"""
+Listing serialization (user-025): task rows are rendered straight to JSON with orjson
+instead of being validated into pydantic models first. The benchmark prints the per-row
+cost of both paths; the output must be the same document.
+"""
+import json
+import time
+
+from sqlalchemy import text
+
+
+def _per_row(render, rows, repeat=5):
+    """Best-of-`repeat` time to render `rows`, in microseconds per row."""
+    best = min(_timed(render, rows) for _ in range(repeat))
+    return best / len(rows) * 1e6
+
+
+def _timed(render, rows):
+    start = time.perf_counter()
+    render(rows)
+    return time.perf_counter() - start
+
+
+def test_row_dicts_render_like_the_response_model_and_faster(run, db):
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    from pydantic import TypeAdapter
+    from typing import List
+    from app.api.controller_schemas.responses.task_schemas import TaskResponse
+    from app.api.responses import row_dicts
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+    project = run(SQLAlchemyProjectRepository(db).create("p"))
+
+    async def seed():
+        await db.execute(text(
+            "INSERT INTO tasks (title, description, status, deadline, created_at, updated_at, closed_at, project_id) "
+            "SELECT 'task ' || n, 'description of task ' || n, "
+            "CASE WHEN n % 3 = 0 THEN 'DONE'::taskstatus ELSE 'TODO'::taskstatus END, "
+            "now() + n * interval '1 hour', now(), now(), "
+            "CASE WHEN n % 3 = 0 THEN now() END, CAST(:project_id AS integer) "
+            "FROM generate_series(1, 2000) AS n"
+        ), {"project_id": project.id})
+        await db.commit()
+
+    run(seed())
+    rows = run(SQLAlchemyTaskRepository(db).list_by_project(project))
+    assert len(rows) == 2000
+
+    adapter = TypeAdapter(List[TaskResponse])
+
+    def through_models(rows):
+        # What response_model=List[TaskResponse] did: validate, dump to JSON types, json.dumps
+        models = adapter.validate_python(rows, from_attributes=True)
+        return json.dumps(adapter.dump_python(models, mode="json")).encode()
+
+    def through_orjson(rows):
+        return ORJSONResponse(row_dicts(rows)).body
+
+    assert orjson.loads(through_orjson(rows)) == json.loads(through_models(rows))
+
+    models = _per_row(through_models, rows)
+    direct = _per_row(through_orjson, rows)
+    print(f"\nserializing {len(rows)} task rows: {models:.2f} us/row through pydantic models, "
+          f"{direct:.2f} us/row with orjson row dicts")
+    assert direct < models
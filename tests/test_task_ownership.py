@@ -0,0 +1,69 @@
+"""
+Project-scoped task lookups (user-011): get_in_project checks the project and fetches the
+task in one round trip and still tells a missing project from a missing task.
+The benchmark prints per-lookup latency against the former two sequential fetches.
+"""
+import pytest
+
+from tests.timing import median_latency
+
+
+def make_task(run, db):
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+    project = run(SQLAlchemyProjectRepository(db).create("p"))
+    return project, run(SQLAlchemyTaskRepository(db).create(project, "t"))
+
+
+def test_get_in_project_is_one_statement(run, db, statements):
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+    project, task = make_task(run, db)
+    statements.clear()
+    assert run(SQLAlchemyTaskRepository(db).get_in_project(project.id, task.id)) is task
+    assert len(statements) == 1
+
+
+def test_get_in_project_distinguishes_missing_project_and_task(run, db):
+    from app.exceptions.repository_exceptions import ProjectNotFoundError, TaskNotFoundError
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+    project, task = make_task(run, db)
+    repo = SQLAlchemyTaskRepository(db)
+    with pytest.raises(ProjectNotFoundError):
+        run(repo.get_in_project(project.id + 1, task.id))
+    with pytest.raises(TaskNotFoundError):
+        run(repo.get_in_project(project.id, task.id + 1))
+
+
+def test_change_task_status_round_trips(run, db, statements):
+    from app.core.config import get_config
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+    from app.services.task_service import TaskService
+
+    project, task = make_task(run, db)
+    service = TaskService(SQLAlchemyProjectRepository(db), SQLAlchemyTaskRepository(db), get_config())
+    db.expunge_all()
+    statements.clear()
+    run(service.change_task_status(project.id, task.id, "doing"))
+    assert [sql.split()[0] for sql, _ in statements] == ["SELECT", "UPDATE"]
+
+
+def test_scoped_lookup_latency(run, db):
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+    project, task = make_task(run, db)
+    projects = SQLAlchemyProjectRepository(db)
+    tasks = SQLAlchemyTaskRepository(db)
+
+    async def two_fetches():
+        await projects.get(project.id)
+        await tasks.get(task.id)
+
+    scoped = median_latency(run, lambda: tasks.get_in_project(project.id, task.id), repeat=50)
+    sequential = median_latency(run, two_fetches, repeat=50)
+    print(f"\ntask lookup: get_in_project {scoped * 1000:.3f} ms, project + task fetch {sequential * 1000:.3f} ms")
+    assert scoped < sequential
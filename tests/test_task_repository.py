@@ -0,0 +1,44 @@
+"""Task repository write paths."""
+
+
+def test_empty_batch_takes_no_project_lock(run, db, statements):
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+    project = run(SQLAlchemyProjectRepository(db).create("p"))
+    statements.clear()
+    assert run(SQLAlchemyTaskRepository(db).create_many_if_below_limit(project, 10, [])) == []
+    assert statements == []
+    assert not db.in_transaction()
+
+
+def test_writes_are_one_statement_each(run, db, statements):
+    """INSERT/UPDATE ... RETURNING bring back server-generated values; no refresh() SELECT follows."""
+    from app.models.task import TaskStatus
+    from app.repositories.project_repository import SQLAlchemyProjectRepository
+    from app.repositories.task_repository import SQLAlchemyTaskRepository
+
+    projects = SQLAlchemyProjectRepository(db)
+    tasks = SQLAlchemyTaskRepository(db)
+
+    statements.clear()
+    project = run(projects.create("p"))
+    assert [sql.split()[0] for sql, _ in statements] == ["INSERT"]
+    assert project.id is not None and project.revision is not None
+
+    statements.clear()
+    task = run(tasks.create(project, "t"))
+    assert [sql.split()[0] for sql, _ in statements] == ["INSERT"]
+    assert task.id is not None and task.revision is not None
+
+    statements.clear()
+    created_revision = task.revision
+    task.status = TaskStatus.DOING
+    run(tasks.update(task))
+    assert [sql.split()[0] for sql, _ in statements] == ["UPDATE"]
+    assert task.revision > created_revision
+
+    statements.clear()
+    project.description = "changed"
+    run(projects.update(project))
+    assert [sql.split()[0] for sql, _ in statements] == ["UPDATE"]
@@ -0,0 +1,14 @@
+import statistics
+import time
+from typing import Any, Awaitable, Callable
+
+
+def median_latency(run: Callable[[Awaitable[Any]], Any], make_call: Callable[[], Awaitable[Any]],
+                   repeat: int = 20) -> float:
+    """Median wall time of `repeat` awaited calls, in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(make_call())
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)